@@ -1,5 +1,7 @@
 """Configuration management for Zwift Control API using Pydantic settings."""
 
+from functools import cached_property
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -47,6 +49,29 @@ class Settings(BaseSettings):
         default="LaunchSauceRemote", description="Scheduled task name for Sauce"
     )
 
+    # Wake-on-LAN payload, computed once per process
+    @cached_property
+    def wol_packet(self) -> bytes:
+        """Precomputed WoL magic packet: 6 x 0xFF followed by the MAC 16 times."""
+        mac = bytes.fromhex(self.pc_mac.replace(":", "").replace("-", ""))
+        return b"\xff" * 6 + mac * 16
+
+    # Sanitized identifiers for logging, computed once per process
+    @cached_property
+    def pc_name_redacted(self) -> str:
+        """PC name safe for logging (first 4 characters only)."""
+        return f"{self.pc_name[:4]}***"
+
+    @cached_property
+    def pc_ip_redacted(self) -> str:
+        """PC IP safe for logging (last octet masked)."""
+        return f"{self.pc_ip.rsplit('.', 1)[0]}.**"
+
+    @cached_property
+    def pc_mac_redacted(self) -> str:
+        """PC MAC safe for logging (last two octets only)."""
+        return f"**:**:**:**:{self.pc_mac[-5:]}"
+
 
 # Global settings instance
 settings = Settings()
@@ -1,19 +1,32 @@
 """FastAPI application for Zwift PC remote control."""
 
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.config import settings
+from api.middleware import FastCORS
 from api.models import HealthResponse
 from api.routers import control, status
-
-# Configure logging
+from api.services.task_manager import task_manager
+from api.utils.clock import now_utc
+
+# Configure logging through a queue so log records are formatted and
+# written on a background thread instead of blocking the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
 logging.basicConfig(
     level=getattr(logging, settings.log_level.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener = QueueListener(_log_queue, _stream_handler)
+_log_listener.start()
 
 logger = logging.getLogger(__name__)
 
@@ -24,33 +37,31 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
 # NOTE: Wildcard origins required for iOS Shortcuts (dynamic LAN IPs)
 # See SECURITY.md for security implications - LOCAL NETWORK ONLY
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Local network only - see SECURITY.md
-    allow_credentials=False,  # No credentials used (no authentication)
-    allow_methods=["GET", "POST"],  # Explicit methods only
-    allow_headers=["Content-Type"],  # Explicit headers only
-)
+app.add_middleware(FastCORS)
 
 # Include routers
 app.include_router(control.router)
 app.include_router(status.router)
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+@app.get("/health", response_model=None, responses={200: {"model": HealthResponse}})
+async def health_check() -> dict:
     """
     Health check endpoint for Docker healthcheck.
 
+    Returns a plain dict to skip response-model validation on this
+    high-frequency endpoint; HealthResponse documents the schema.
+
     Returns:
-        HealthResponse indicating API is healthy
+        Dict indicating API is healthy
     """
-    return HealthResponse(status="healthy")
+    return {"status": "healthy", "timestamp": now_utc()}
 
 
 @app.on_event("startup")
@@ -59,16 +70,17 @@ async def startup_event():
     logger.info("=" * 60)
     logger.info("Zwift Control API starting...")
     # Sanitize sensitive data in logs
-    logger.info(f"PC Name: {settings.pc_name[:4]}***")
-    logger.info(f"PC IP: {settings.pc_ip.rsplit('.', 1)[0]}.**")
-    logger.info(f"PC MAC: **:**:**:**:{settings.pc_mac[-5:]}")
+    logger.info(f"PC Name: {settings.pc_name_redacted}")
+    logger.info(f"PC IP: {settings.pc_ip_redacted}")
+    logger.info(f"PC MAC: {settings.pc_mac_redacted}")
     logger.info(f"Log Level: {settings.log_level}")
     logger.info("=" * 60)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log shutdown information."""
+    """Close shared resources and log shutdown information."""
+    await task_manager.pc_control.aclose()
     logger.info("Zwift Control API shutting down...")
 
 
@@ -80,4 +92,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=settings.api_port,
         log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
     )
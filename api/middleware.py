@@ -0,0 +1,47 @@
+"""Lightweight ASGI middleware for the Zwift Control API."""
+
+# Constant CORS headers - the policy is a fixed wildcard for the local
+# network (see SECURITY.md), so nothing needs to be computed per request
+_ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+_PREFLIGHT_HEADERS = [
+    _ALLOW_ORIGIN,
+    (b"access-control-allow-methods", b"GET, POST"),
+    (b"access-control-allow-headers", b"Content-Type"),
+]
+
+
+class FastCORS:
+    """
+    Minimal CORS layer for the fixed local-network policy.
+
+    Replaces Starlette's CORSMiddleware: preflight requests get an
+    immediate 204 with constant headers, and normal responses gain the
+    wildcard allow-origin header, with no per-request header parsing or
+    origin matching.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": _PREFLIGHT_HEADERS,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), _ALLOW_ORIGIN]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
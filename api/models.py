@@ -5,7 +5,14 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from api.utils.clock import now_utc
+
+# Shared config for response-only models: they are built from trusted
+# internal data and never mutated, so freeze them and skip the unused
+# validation features
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra="forbid", validate_default=False)
 
 
 class TaskStatus(str, Enum):
@@ -20,34 +27,36 @@ class TaskStatus(str, Enum):
 class PCStatus(BaseModel):
     """PC online status response."""
 
+    model_config = _RESPONSE_CONFIG
+
     online: bool = Field(description="Whether the PC is reachable via ping")
     ssh_available: bool = Field(default=False, description="Whether SSH connection is available")
     ip_address: str = Field(description="PC IP address")
     response_time_ms: Optional[int] = Field(
         default=None, description="Ping response time in milliseconds"
     )
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Timestamp of status check"
-    )
+    timestamp: datetime = Field(default_factory=now_utc, description="Timestamp of status check")
 
 
 class ZwiftStatus(BaseModel):
     """Zwift process status response."""
 
+    model_config = _RESPONSE_CONFIG
+
     running: bool = Field(description="Whether Zwift is running")
     process_id: Optional[int] = Field(default=None, description="Zwift process ID if running")
     cpu_usage: Optional[float] = Field(
         default=None, description="CPU usage in seconds (cumulative)"
     )
     memory_mb: Optional[int] = Field(default=None, description="Memory usage in megabytes")
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Timestamp of status check"
-    )
+    timestamp: datetime = Field(default_factory=now_utc, description="Timestamp of status check")
 
 
 class ServiceStatus(BaseModel):
     """Windows service status."""
 
+    model_config = _RESPONSE_CONFIG
+
     name: str = Field(description="Service name")
     running: bool = Field(description="Whether the service is running")
     status: Optional[str] = Field(default=None, description="Service status string")
@@ -56,15 +65,15 @@ class ServiceStatus(BaseModel):
 class FullStatus(BaseModel):
     """Comprehensive system status."""
 
+    model_config = _RESPONSE_CONFIG
+
     pc: PCStatus = Field(description="PC online status")
     zwift: Optional[ZwiftStatus] = Field(
         default=None, description="Zwift status (null if PC offline)"
     )
     sunshine: Optional[ServiceStatus] = Field(default=None, description="Sunshine service status")
     obs: Optional[ZwiftStatus] = Field(default=None, description="OBS status")
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Timestamp of status check"
-    )
+    timestamp: datetime = Field(default_factory=now_utc, description="Timestamp of status check")
 
 
 class TaskProgress(BaseModel):
@@ -84,9 +93,7 @@ class Task(BaseModel):
     task_type: str = Field(description="Type of task (start, wake, etc.)")
     progress: Optional[TaskProgress] = Field(default=None, description="Task progress information")
     error: Optional[str] = Field(default=None, description="Error message if task failed")
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Task creation timestamp"
-    )
+    created_at: datetime = Field(default_factory=now_utc, description="Task creation timestamp")
     started_at: Optional[datetime] = Field(default=None, description="Task start timestamp")
     completed_at: Optional[datetime] = Field(default=None, description="Task completion timestamp")
 
@@ -94,6 +101,8 @@ class Task(BaseModel):
 class StartResponse(BaseModel):
     """Response from start endpoint."""
 
+    model_config = _RESPONSE_CONFIG
+
     task_id: UUID = Field(description="Task ID for tracking progress")
     message: str = Field(description="Informational message")
     estimated_duration_seconds: int = Field(default=180, description="Estimated time to completion")
@@ -102,6 +111,8 @@ class StartResponse(BaseModel):
 class StopResponse(BaseModel):
     """Response from stop endpoint."""
 
+    model_config = _RESPONSE_CONFIG
+
     success: bool = Field(description="Whether shutdown command was sent successfully")
     message: str = Field(description="Informational message")
 
@@ -109,6 +120,8 @@ class StopResponse(BaseModel):
 class WakeResponse(BaseModel):
     """Response from wake endpoint."""
 
+    model_config = _RESPONSE_CONFIG
+
     task_id: UUID = Field(description="Task ID for tracking progress")
     message: str = Field(description="Informational message")
     estimated_duration_seconds: int = Field(default=60, description="Estimated time for PC to boot")
@@ -117,6 +130,8 @@ class WakeResponse(BaseModel):
 class SunshineResponse(BaseModel):
     """Response from Sunshine control endpoints."""
 
+    model_config = _RESPONSE_CONFIG
+
     success: bool = Field(description="Whether the operation was successful")
     message: str = Field(description="Informational message")
     service_status: Optional[ServiceStatus] = Field(
@@ -127,7 +142,7 @@ class SunshineResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response."""
 
+    model_config = _RESPONSE_CONFIG
+
     status: str = Field(default="healthy", description="API health status")
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Health check timestamp"
-    )
+    timestamp: datetime = Field(default_factory=now_utc, description="Health check timestamp")
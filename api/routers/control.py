@@ -3,7 +3,7 @@
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from api.config import settings
 from api.models import (
@@ -22,9 +22,23 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/control", tags=["control"])
 
+# Initialize services once at module load so request handlers reuse them
+pc_control = PCControlService()
+status_checker = StatusChecker()
+
+
+def get_pc_control() -> PCControlService:
+    """Provide the shared PC control service (overridable in tests)."""
+    return pc_control
+
+
+def get_status_checker() -> StatusChecker:
+    """Provide the shared status checker (overridable in tests)."""
+    return status_checker
+
 
 @router.post("/start", response_model=StartResponse)
-async def start_zwift(background_tasks: BackgroundTasks) -> StartResponse:
+async def start_zwift() -> StartResponse:
     """
     Wake PC and launch Zwift (full start sequence).
 
@@ -43,13 +57,13 @@ async def start_zwift(background_tasks: BackgroundTasks) -> StartResponse:
     Returns:
         StartResponse with task ID for progress tracking
     """
-    logger.info("Start Zwift request received")
+    logger.debug("Start Zwift request received")
 
     # Create task
     task = task_manager.create_task("start")
 
-    # Run start sequence in background
-    background_tasks.add_task(task_manager.run_start_sequence, task.task_id)
+    # Run start sequence in the background (starts before the response is sent)
+    task_manager.launch(task.task_id, task_manager.run_start_sequence)
 
     return StartResponse(
         task_id=task.task_id,
@@ -59,7 +73,7 @@ async def start_zwift(background_tasks: BackgroundTasks) -> StartResponse:
 
 
 @router.post("/stop", response_model=StopResponse)
-async def stop_pc() -> StopResponse:
+async def stop_pc(pc_control: PCControlService = Depends(get_pc_control)) -> StopResponse:
     """
     Shutdown the Zwift PC.
 
@@ -69,7 +83,7 @@ async def stop_pc() -> StopResponse:
     Returns:
         StopResponse with success status
     """
-    logger.info("Stop PC request received")
+    logger.debug("Stop PC request received")
 
     # Check if PC is online first
     is_online, _ = await ping_host(settings.pc_ip, timeout=1)
@@ -80,7 +94,6 @@ async def stop_pc() -> StopResponse:
         )
 
     # Send shutdown command
-    pc_control = PCControlService()
     success = await pc_control.shutdown_pc()
 
     if not success:
@@ -96,7 +109,7 @@ async def stop_pc() -> StopResponse:
 
 
 @router.post("/wake", response_model=WakeResponse)
-async def wake_pc(background_tasks: BackgroundTasks) -> WakeResponse:
+async def wake_pc() -> WakeResponse:
     """
     Wake PC via WoL (no Zwift launch).
 
@@ -110,13 +123,13 @@ async def wake_pc(background_tasks: BackgroundTasks) -> WakeResponse:
     Returns:
         WakeResponse with task ID for progress tracking
     """
-    logger.info("Wake PC request received")
+    logger.debug("Wake PC request received")
 
     # Create task
     task = task_manager.create_task("wake")
 
-    # Run wake sequence in background
-    background_tasks.add_task(task_manager.run_wake_sequence, task.task_id)
+    # Run wake sequence in the background (starts before the response is sent)
+    task_manager.launch(task.task_id, task_manager.run_wake_sequence)
 
     return WakeResponse(
         task_id=task.task_id,
@@ -126,12 +139,14 @@ async def wake_pc(background_tasks: BackgroundTasks) -> WakeResponse:
 
 
 @router.get("/tasks/{task_id}", response_model=Task)
-async def get_task_status(task_id: UUID) -> Task:
+async def get_task_status(task_id: UUID, wait: bool = False) -> Task:
     """
     Get status of a background task.
 
     Args:
         task_id: Task UUID returned from start/wake endpoints
+        wait: If true, long-poll up to 60s until the task finishes
+            instead of returning the current state immediately
 
     Returns:
         Task object with current status and progress
@@ -139,6 +154,33 @@ async def get_task_status(task_id: UUID) -> Task:
     Raises:
         HTTPException: If task ID not found
     """
+    if wait:
+        task = await task_manager.wait_for_completion(task_id)
+    else:
+        task = task_manager.get_task(task_id)
+    if not task:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Task {task_id} not found",
+        )
+
+    return task_manager.to_response(task)
+
+
+@router.delete("/tasks/{task_id}", response_model=Task)
+async def cancel_task(task_id: UUID) -> Task:
+    """
+    Cancel a running background task.
+
+    Args:
+        task_id: Task UUID returned from start/wake endpoints
+
+    Returns:
+        Task object marked as failed with a cancellation error
+
+    Raises:
+        HTTPException: If task ID not found or task is not running
+    """
     task = task_manager.get_task(task_id)
     if not task:
         raise HTTPException(
@@ -146,11 +188,20 @@ async def get_task_status(task_id: UUID) -> Task:
             detail=f"Task {task_id} not found",
         )
 
-    return task
+    if not task_manager.cancel_task(task_id):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Task {task_id} is not running and cannot be cancelled",
+        )
+
+    return task_manager.to_response(task_manager.get_task(task_id))
 
 
 @router.post("/sunshine/stop", response_model=SunshineResponse)
-async def stop_sunshine() -> SunshineResponse:
+async def stop_sunshine(
+    pc_control: PCControlService = Depends(get_pc_control),
+    status_checker: StatusChecker = Depends(get_status_checker),
+) -> SunshineResponse:
     """
     Stop Sunshine game streaming service.
 
@@ -163,10 +214,9 @@ async def stop_sunshine() -> SunshineResponse:
     Raises:
         HTTPException: If PC is offline or SSH unavailable
     """
-    logger.info("Stop Sunshine request received")
+    logger.debug("Stop Sunshine request received")
 
     # Check PC status
-    status_checker = StatusChecker()
     pc_status = await status_checker.check_pc_online()
 
     if not pc_status.online:
@@ -182,7 +232,6 @@ async def stop_sunshine() -> SunshineResponse:
         )
 
     # Stop Sunshine
-    pc_control = PCControlService()
     success = await pc_control.stop_sunshine()
 
     if not success:
@@ -192,7 +241,7 @@ async def stop_sunshine() -> SunshineResponse:
         )
 
     # Get current service status
-    service_status = await status_checker.check_sunshine_status()
+    service_status = await status_checker.check_sunshine_status(force=True)
 
     return SunshineResponse(
         success=True,
@@ -202,7 +251,10 @@ async def stop_sunshine() -> SunshineResponse:
 
 
 @router.post("/sunshine/start", response_model=SunshineResponse)
-async def start_sunshine() -> SunshineResponse:
+async def start_sunshine(
+    pc_control: PCControlService = Depends(get_pc_control),
+    status_checker: StatusChecker = Depends(get_status_checker),
+) -> SunshineResponse:
     """
     Start Sunshine game streaming service.
 
@@ -216,10 +268,9 @@ async def start_sunshine() -> SunshineResponse:
     Raises:
         HTTPException: If PC is offline or SSH unavailable
     """
-    logger.info("Start Sunshine request received")
+    logger.debug("Start Sunshine request received")
 
     # Check PC status
-    status_checker = StatusChecker()
     pc_status = await status_checker.check_pc_online()
 
     if not pc_status.online:
@@ -235,7 +286,6 @@ async def start_sunshine() -> SunshineResponse:
         )
 
     # Start Sunshine
-    pc_control = PCControlService()
     success = await pc_control.start_sunshine()
 
     if not success:
@@ -245,7 +295,7 @@ async def start_sunshine() -> SunshineResponse:
         )
 
     # Get current service status
-    service_status = await status_checker.check_sunshine_status()
+    service_status = await status_checker.check_sunshine_status(force=True)
 
     return SunshineResponse(
         success=True,
@@ -255,7 +305,10 @@ async def start_sunshine() -> SunshineResponse:
 
 
 @router.post("/sunshine/toggle", response_model=SunshineResponse)
-async def toggle_sunshine() -> SunshineResponse:
+async def toggle_sunshine(
+    pc_control: PCControlService = Depends(get_pc_control),
+    status_checker: StatusChecker = Depends(get_status_checker),
+) -> SunshineResponse:
     """
     Toggle Sunshine game streaming service (start if stopped, stop if running).
 
@@ -269,10 +322,9 @@ async def toggle_sunshine() -> SunshineResponse:
     Raises:
         HTTPException: If PC is offline or SSH unavailable
     """
-    logger.info("Toggle Sunshine request received")
+    logger.debug("Toggle Sunshine request received")
 
     # Check PC status
-    status_checker = StatusChecker()
     pc_status = await status_checker.check_pc_online()
 
     if not pc_status.online:
@@ -288,8 +340,7 @@ async def toggle_sunshine() -> SunshineResponse:
         )
 
     # Check current Sunshine status
-    service_status = await status_checker.check_sunshine_status()
-    pc_control = PCControlService()
+    service_status = await status_checker.check_sunshine_status(force=True)
 
     # Toggle based on current state
     if service_status.running:
@@ -308,7 +359,7 @@ async def toggle_sunshine() -> SunshineResponse:
         )
 
     # Get updated service status
-    service_status = await status_checker.check_sunshine_status()
+    service_status = await status_checker.check_sunshine_status(force=True)
 
     return SunshineResponse(
         success=True,
@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from api.models import FullStatus, PCStatus, ZwiftStatus
 from api.services.status_checker import StatusChecker
@@ -23,7 +24,7 @@ async def get_pc_status() -> PCStatus:
     Returns:
         PCStatus with online status, SSH availability, and response time
     """
-    logger.info("PC status check requested")
+    logger.debug("PC status check requested")
     return await status_checker.check_pc_online()
 
 
@@ -37,7 +38,7 @@ async def get_zwift_status() -> ZwiftStatus:
     Returns:
         ZwiftStatus with process information if running
     """
-    logger.info("Zwift status check requested")
+    logger.debug("Zwift status check requested")
 
     # Check PC online and SSH availability first
     pc_status = await status_checker.check_pc_online()
@@ -58,8 +59,8 @@ async def get_zwift_status() -> ZwiftStatus:
     return await status_checker.check_zwift_running()
 
 
-@router.get("/full", response_model=FullStatus)
-async def get_full_status() -> FullStatus:
+@router.get("/full", response_model=None, responses={200: {"model": FullStatus}})
+async def get_full_status() -> ORJSONResponse:
     """
     Get comprehensive system status.
 
@@ -69,8 +70,13 @@ async def get_full_status() -> FullStatus:
     - Sunshine service status (if PC online)
     - OBS process status (if PC online)
 
+    Serializes the already-validated FullStatus directly, skipping
+    FastAPI's response-model re-validation on this hot polling path;
+    FullStatus documents the schema.
+
     Returns:
         FullStatus with all system information
     """
-    logger.info("Full status check requested")
-    return await status_checker.check_full_status()
+    logger.debug("Full status check requested")
+    full_status = await status_checker.check_full_status()
+    return ORJSONResponse(full_status.model_dump(mode="json"))
@@ -4,8 +4,10 @@ import asyncio
 import logging
 
 from api.config import settings
-from api.utils.network import send_wol_packet, wait_for_ping
-from api.utils.ssh_client import SSHClient
+from api.services.status_checker import StatusChecker
+from api.utils.network import send_wol_packet
+from api.utils.poller import Poller
+from api.utils.ssh_client import get_ssh_client
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +16,35 @@ class PCControlService:
     """Service for controlling the Zwift PC remotely."""
 
     def __init__(self):
-        """Initialize PC control service with SSH client."""
-        self.ssh = SSHClient(
+        """Initialize PC control service with the shared SSH client."""
+        self.ssh = get_ssh_client(
             host=settings.pc_ip,
             username=settings.pc_user,
             key_path=settings.ssh_key_path,
             connect_timeout=settings.ssh_connect_timeout,
         )
+        self.status_checker = StatusChecker()
+        # Backoff schedule shared by the desktop and Zwift waits; tests
+        # inject a single-shot poller here to skip the waiting
+        self._poller = Poller(initial_delay=0.5, max_delay=3.0)
+        # Snapshot the settings used in hot paths into plain attributes:
+        # one descriptor lookup at construction instead of one per call,
+        # and immune to settings growing a dynamic backend later
+        self._pc_name = settings.pc_name
+        self._pc_ip = settings.pc_ip
+        self._pc_mac = settings.pc_mac
+        self._wol_packet = settings.wol_packet
+        self._wol_timeout = settings.wol_timeout
+        self._ssh_timeout = settings.ssh_timeout
+        self._desktop_timeout = settings.desktop_timeout
+        self._zwift_timeout = settings.zwift_timeout
+        self._zwift_task = settings.zwift_scheduled_task
+        self._launcher_keys_task = settings.zwift_launcher_keys_task
+        self._sauce_task = settings.sauce_scheduled_task
+
+    async def aclose(self) -> None:
+        """Release the shared SSH connection (app shutdown hook)."""
+        await self.ssh.close()
 
     async def wake_pc(self) -> bool:
         """
@@ -29,54 +53,63 @@ class PCControlService:
         Returns:
             True if WoL packet was sent successfully
         """
-        logger.info(f"Sending WoL packet to {settings.pc_name} ({settings.pc_mac})")
-        return await send_wol_packet(settings.pc_mac)
-
-    async def wait_for_network(self) -> bool:
-        """
-        Wait for PC to respond to ping after WoL.
-
-        Returns:
-            True if PC responded within timeout
-        """
-        return await wait_for_ping(settings.pc_ip, timeout=settings.wol_timeout, check_interval=2)
+        logger.info(f"Sending WoL packet to {self._pc_name} ({self._pc_mac})")
+        return await send_wol_packet(self._wol_packet)
 
     async def wait_for_ssh(self) -> bool:
         """
-        Wait for SSH to become available on the PC.
+        Wait for the PC to come up and SSH to become available.
+
+        SSH readiness implies network readiness, so this single poll
+        replaces the former ping-then-SSH stages; its budget covers the
+        whole boot window, and the short per-attempt connect timeout
+        keeps early probes cheap while the PC is still booting.
 
         Returns:
             True if SSH became available within timeout
         """
-        return await self.ssh.wait_for_availability(timeout=settings.ssh_timeout, check_interval=2)
+        return await self.ssh.wait_for_availability(
+            timeout=self._wol_timeout + self._ssh_timeout,
+            check_interval=0.5,
+            connect_timeout=2,
+        )
 
     async def wait_for_desktop(self) -> bool:
         """
         Wait for Windows desktop to load (explorer.exe process).
 
+        Raced against ``wait_for_ssh`` from the moment the WoL packet is
+        away, so like the SSH wait its budget spans the whole boot
+        window, with the desktop's own allowance on top for the stretch
+        between sshd answering and explorer appearing.
+
         Returns:
             True if desktop loaded within timeout
         """
         logger.info("Waiting for Windows desktop to load...")
         start_time = asyncio.get_event_loop().time()
+        timeout = self._wol_timeout + self._ssh_timeout + self._desktop_timeout
 
-        while (asyncio.get_event_loop().time() - start_time) < settings.desktop_timeout:
-            try:
-                stdout, _, return_code = await self.ssh.execute_powershell(
-                    "Get-Process explorer -ErrorAction SilentlyContinue | Select-Object -First 1"
-                )
-                if return_code == 0 and stdout:
-                    elapsed = int(asyncio.get_event_loop().time() - start_time)
-                    logger.info(f"Desktop loaded (took {elapsed}s)")
-                    return True
-            except Exception as e:
-                logger.debug(f"Desktop check failed: {e}")
-
-            await asyncio.sleep(2)
+        if await self._poller.wait_until(self._probe_desktop, timeout=timeout):
+            elapsed = int(asyncio.get_event_loop().time() - start_time)
+            logger.info(f"Desktop loaded (took {elapsed}s)")
+            return True
 
-        logger.warning(f"Desktop did not load within {settings.desktop_timeout}s")
+        logger.warning(f"Desktop did not load within {timeout}s")
         return False
 
+    async def _probe_desktop(self) -> bool:
+        """Probe once for the explorer.exe process on the PC."""
+        try:
+            stdout, _, return_code = await self.ssh.execute_powershell_stream(
+                "Get-Process explorer -ErrorAction SilentlyContinue | Select-Object -First 1",
+                timeout=5,
+            )
+            return return_code == 0 and bool(stdout)
+        except Exception as e:
+            logger.debug(f"Desktop check failed: {e}")
+            return False
+
     async def kill_zwift_processes(self) -> bool:
         """
         Kill any existing Zwift processes (ZwiftLauncher, ZwiftApp, Zwift).
@@ -103,7 +136,7 @@ class PCControlService:
                     Write-Host 'No Zwift processes found'
                 }
             """
-            stdout, stderr, return_code = await self.ssh.execute_powershell(script, timeout=10)
+            stdout, _, return_code = await self.ssh.execute_powershell_stream(script, timeout=10)
             logger.info(f"Zwift processes: {stdout.strip()}")
             return True
         except Exception as e:
@@ -132,6 +165,44 @@ class PCControlService:
             logger.error(f"Error stopping Sunshine service: {e}")
             return False
 
+    async def stop_sunshine_and_kill_zwift(self) -> tuple[bool, bool]:
+        """
+        Stop Sunshine and kill stale Zwift processes in one SSH call.
+
+        The two cleanup actions always run together before a launch, so
+        batching them into a single PowerShell payload pays one SSH
+        round-trip and one runspace start instead of two of each.
+
+        Returns:
+            Tuple of (sunshine_stopped, zwift_killed)
+        """
+        logger.info("Stopping Sunshine and killing stale Zwift processes...")
+        try:
+            script = (
+                "$sunshine = 'stopped'; "
+                "$service = Get-Service SunshineService -ErrorAction SilentlyContinue; "
+                "if ($service) { "
+                "if ($service.Status -eq 'Running') { "
+                "Stop-Service -Name SunshineService -Force -ErrorAction SilentlyContinue; "
+                "Start-Sleep -Seconds 2 }; "
+                "$process = Get-Process sunshine -ErrorAction SilentlyContinue; "
+                "if ($process) { Stop-Process -Id $process.Id -Force; Start-Sleep -Seconds 1 }; "
+                "if ((Get-Service SunshineService).Status -ne 'Stopped') { $sunshine = 'failed' } "
+                "} else { $sunshine = 'missing' }; "
+                "$stale = @(Get-Process -Name 'ZwiftApp','ZwiftLauncher','Zwift'"
+                " -ErrorAction SilentlyContinue); "
+                "if ($stale) { $stale | Stop-Process -Force -ErrorAction SilentlyContinue; "
+                "Start-Sleep -Seconds 2 }; "
+                'Write-Host "sunshine=$sunshine killed=$($stale.Count)"'
+            )
+            stdout, stderr, return_code = await self.ssh.execute_powershell(script, timeout=20)
+            logger.info(f"Pre-launch cleanup: {stdout.strip()}")
+            return "sunshine=stopped" in stdout, True
+        except Exception as e:
+            logger.warning(f"Error in pre-launch cleanup: {e}")
+            # Killing stale processes is non-critical either way
+            return False, True
+
     async def start_sunshine(self) -> bool:
         """
         Start Sunshine service for remote game streaming.
@@ -164,7 +235,7 @@ class PCControlService:
         """
         logger.info("Launching Zwift via scheduled task...")
         try:
-            command = f'schtasks /Run /TN "{settings.zwift_scheduled_task}"'
+            command = f'schtasks /Run /TN "{self._zwift_task}"'
             stdout, stderr, return_code = await self.ssh.execute(command)
             if return_code == 0:
                 logger.info("Zwift launch task triggered")
@@ -176,6 +247,36 @@ class PCControlService:
             logger.error(f"Error launching Zwift: {e}")
             return False
 
+    async def _wait_for_launcher_automation(self, timeout: int = 35) -> None:
+        """
+        Wait for the remote launcher automation, exiting early if possible.
+
+        The ZwiftLauncherKeys task needs up to ~35s (30s internal wait +
+        buffer), but the main app usually appears sooner; polling for
+        ZwiftApp lets the sequence move on as soon as it does.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+        delay = 2.0
+        while (loop.time() - start_time) < timeout:
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 5.0)
+            try:
+                stdout, _, return_code = await self.ssh.execute_powershell_stream(
+                    "Get-Process ZwiftApp -ErrorAction SilentlyContinue | Select-Object -First 1",
+                    timeout=10,
+                )
+                if return_code == 0 and stdout:
+                    elapsed = int(loop.time() - start_time)
+                    logger.info(f"Zwift detected after launcher automation ({elapsed}s)")
+                    return
+            except Exception as e:
+                logger.debug(f"Zwift check failed during launcher wait: {e}")
+        logger.info(f"Launcher automation window of {timeout}s elapsed")
+
     async def activate_zwift_launcher(self) -> bool:
         """
         Send keyboard input to Zwift launcher (Tab, Tab, Enter).
@@ -197,14 +298,12 @@ class PCControlService:
             # Trigger the ZwiftLauncherKeys scheduled task
             # This task runs in the user's interactive session where it can
             # access the launcher window and send keyboard input
-            command = f'schtasks /Run /TN "{settings.zwift_launcher_keys_task}"'
+            command = f'schtasks /Run /TN "{self._launcher_keys_task}"'
             stdout, stderr, return_code = await self.ssh.execute(command, timeout=10)
 
             if return_code == 0:
                 logger.info("Launcher activation task triggered")
-                # Wait for the automation script to complete (30s internal wait + 5s buffer)
-                logger.info("Waiting 35 seconds for launcher automation to complete...")
-                await asyncio.sleep(35)
+                await self._wait_for_launcher_automation()
                 return True
             else:
                 logger.warning(f"Failed to trigger launcher activation: {stderr}")
@@ -214,6 +313,36 @@ class PCControlService:
             # Not critical - Zwift might launch anyway
             return False
 
+    async def launch_zwift_and_activate(self) -> bool:
+        """
+        Launch Zwift and trigger launcher activation in a single SSH call.
+
+        Batches the two schtasks invocations (launch + ZwiftLauncherKeys)
+        into one remote command so the sequence pays a single SSH
+        round-trip; the activation task only runs if the launch task was
+        triggered successfully.
+
+        Returns:
+            True if both scheduled tasks were triggered successfully
+        """
+        logger.info("Launching Zwift and launcher activation via scheduled tasks...")
+        try:
+            command = (
+                f'schtasks /Run /TN "{self._zwift_task}"'
+                f' && schtasks /Run /TN "{self._launcher_keys_task}"'
+            )
+            stdout, stderr, return_code = await self.ssh.execute(command, timeout=10)
+            if return_code != 0:
+                logger.error(f"Failed to launch Zwift: {stderr}")
+                return False
+
+            logger.info("Zwift launch and activation tasks triggered")
+            await self._wait_for_launcher_automation()
+            return True
+        except Exception as e:
+            logger.error(f"Error launching Zwift: {e}")
+            return False
+
     async def launch_sauce(self) -> bool:
         """
         Launch Sauce for Zwift via scheduled task.
@@ -223,7 +352,7 @@ class PCControlService:
         """
         logger.info("Launching Sauce for Zwift via scheduled task...")
         try:
-            command = f'schtasks /Run /TN "{settings.sauce_scheduled_task}"'
+            command = f'schtasks /Run /TN "{self._sauce_task}"'
             stdout, stderr, return_code = await self.ssh.execute(command)
             if return_code == 0:
                 logger.info("Sauce launch task triggered")
@@ -247,23 +376,26 @@ class PCControlService:
         logger.info("Waiting for Zwift to start...")
         start_time = asyncio.get_event_loop().time()
 
-        while (asyncio.get_event_loop().time() - start_time) < settings.zwift_timeout:
-            try:
-                stdout, _, return_code = await self.ssh.execute_powershell(
-                    "Get-Process ZwiftApp -ErrorAction SilentlyContinue | Select-Object -First 1"
-                )
-                if return_code == 0 and stdout:
-                    elapsed = int(asyncio.get_event_loop().time() - start_time)
-                    logger.info(f"Zwift started (took {elapsed}s)")
-                    return True
-            except Exception as e:
-                logger.debug(f"Zwift check failed: {e}")
-
-            await asyncio.sleep(2)
+        if await self._poller.wait_until(self._probe_zwift, timeout=self._zwift_timeout):
+            elapsed = int(asyncio.get_event_loop().time() - start_time)
+            logger.info(f"Zwift started (took {elapsed}s)")
+            return True
 
-        logger.warning(f"Zwift did not start within {settings.zwift_timeout}s")
+        logger.warning(f"Zwift did not start within {self._zwift_timeout}s")
         return False
 
+    async def _probe_zwift(self) -> bool:
+        """Probe once for the ZwiftApp process on the PC."""
+        try:
+            stdout, _, return_code = await self.ssh.execute_powershell_stream(
+                "Get-Process ZwiftApp -ErrorAction SilentlyContinue | Select-Object -First 1",
+                timeout=5,
+            )
+            return return_code == 0 and bool(stdout)
+        except Exception as e:
+            logger.debug(f"Zwift check failed: {e}")
+            return False
+
     async def set_process_priorities(self) -> bool:
         """
         Set process priorities (Zwift: High, OBS: BelowNormal).
@@ -286,7 +418,7 @@ class PCControlService:
                     Write-Host 'OBS: BelowNormal priority'
                 }
             """
-            stdout, stderr, return_code = await self.ssh.execute_powershell(script)
+            stdout, _, return_code = await self.ssh.execute_powershell_stream(script)
             logger.info(f"Process priorities set: {stdout}")
             return True
         except Exception as e:
@@ -303,8 +435,9 @@ class PCControlService:
         """
         logger.info("Sending shutdown command...")
         try:
+            # Output is irrelevant here; skip capturing it entirely
             command = "shutdown /s /t 5"
-            stdout, stderr, return_code = await self.ssh.execute(command, timeout=10)
+            await self.ssh.execute(command, timeout=10, capture=False)
             logger.info("Shutdown command sent")
             return True
         except Exception as e:
@@ -320,7 +453,6 @@ class PCControlService:
         """
         results = {
             "wol_sent": False,
-            "network_available": False,
             "ssh_available": False,
             "desktop_loaded": False,
             "sunshine_stopped": False,
@@ -333,56 +465,76 @@ class PCControlService:
         }
 
         try:
-            # Step 1: Send WoL packet
-            results["wol_sent"] = await self.wake_pc()
-            if not results["wol_sent"]:
-                return results
-
-            # Step 2: Wait for network
-            results["network_available"] = await self.wait_for_network()
-            if not results["network_available"]:
-                return results
-
-            # Step 3: Wait for SSH
-            results["ssh_available"] = await self.wait_for_ssh()
-            if not results["ssh_available"]:
-                return results
-
-            # Step 4: Wait for desktop
-            results["desktop_loaded"] = await self.wait_for_desktop()
-            if not results["desktop_loaded"]:
-                return results
-
-            # Step 5: Stop Sunshine
-            results["sunshine_stopped"] = await self.stop_sunshine()
-
-            # Step 6: Kill any existing Zwift processes
-            results["zwift_killed"] = await self.kill_zwift_processes()
-
-            # Step 7: Launch Zwift
-            results["zwift_launched"] = await self.launch_zwift()
-            if not results["zwift_launched"]:
-                return results
+            # Scope the shared SSH connection to the sequence: the first
+            # post-boot command opens it, every later step reuses it, and
+            # it is released when the sequence ends
+            async with self.ssh:
+                # Pre-check current state: a PC that is already up (or
+                # already running Zwift) skips up to a minute of waits
+                status = await self.status_checker.check_full_status()
+                already_online = status.pc.online and status.pc.ssh_available
+                if already_online and status.zwift is not None and status.zwift.running:
+                    logger.info("PC online and Zwift already running; nothing to do")
+                    return dict.fromkeys(results, True)
+
+                if already_online:
+                    logger.info("PC already online; skipping wake and boot waits")
+                    results["wol_sent"] = True
+                    results["ssh_available"] = True
+                    results["desktop_loaded"] = True
+                else:
+                    # Step 1: Send WoL packet
+                    results["wol_sent"] = await self.wake_pc()
+                    if not results["wol_sent"]:
+                        return results
+
+                    # Steps 2-3: Race the SSH and desktop waits; desktop
+                    # readiness implies SSH, so both probes start the
+                    # moment the WoL packet is away
+                    ssh_task = asyncio.create_task(self.wait_for_ssh())
+                    desktop_task = asyncio.create_task(self.wait_for_desktop())
+
+                    results["ssh_available"] = await ssh_task
+                    if not results["ssh_available"]:
+                        desktop_task.cancel()
+                        await asyncio.gather(desktop_task, return_exceptions=True)
+                        return results
+
+                    results["desktop_loaded"] = await desktop_task
+                    if not results["desktop_loaded"]:
+                        return results
+
+                # Steps 4-5: Stop Sunshine and kill any existing Zwift
+                # processes in a single batched SSH call
+                (
+                    results["sunshine_stopped"],
+                    results["zwift_killed"],
+                ) = await self.stop_sunshine_and_kill_zwift()
+
+                # Steps 6-7: Launch Zwift (with launcher activation) and
+                # Sauce concurrently; Sauce is independent, so its trigger
+                # overlaps the launcher-automation wait instead of
+                # queueing behind it
+                results["zwift_launched"], results["sauce_launched"] = await asyncio.gather(
+                    self.launch_zwift_and_activate(),
+                    self.launch_sauce(),
+                )
+                if not results["zwift_launched"]:
+                    return results
 
-            # Step 8: Activate Zwift launcher
-            await self.activate_zwift_launcher()
+                # Step 8: Wait for Zwift to start
+                results["zwift_running"] = await self.wait_for_zwift()
+                if not results["zwift_running"]:
+                    return results
 
-            # Step 9: Launch Sauce
-            results["sauce_launched"] = await self.launch_sauce()
+                # Step 9: Set process priorities
+                results["priorities_set"] = await self.set_process_priorities()
 
-            # Step 10: Wait for Zwift to start
-            results["zwift_running"] = await self.wait_for_zwift()
-            if not results["zwift_running"]:
+                # All critical steps succeeded
+                results["success"] = True
+                logger.info("Full start sequence completed successfully")
                 return results
 
-            # Step 11: Set process priorities
-            results["priorities_set"] = await self.set_process_priorities()
-
-            # All critical steps succeeded
-            results["success"] = True
-            logger.info("Full start sequence completed successfully")
-            return results
-
         except Exception as e:
             logger.error(f"Error in start sequence: {e}")
             return results
@@ -396,7 +548,6 @@ class PCControlService:
         """
         results = {
             "wol_sent": False,
-            "network_available": False,
             "ssh_available": False,
             "success": False,
         }
@@ -407,12 +558,8 @@ class PCControlService:
             if not results["wol_sent"]:
                 return results
 
-            # Step 2: Wait for network
-            results["network_available"] = await self.wait_for_network()
-            if not results["network_available"]:
-                return results
-
-            # Step 3: Wait for SSH
+            # Step 2: Wait for SSH (a reachable sshd implies the
+            # network is up, so one poll covers both)
             results["ssh_available"] = await self.wait_for_ssh()
             if not results["ssh_available"]:
                 return results
@@ -1,7 +1,15 @@
 """Status checking service for PC, Zwift, and related services."""
 
-import json
+import asyncio
+import csv
 import logging
+from io import StringIO
+from typing import Optional
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is a required dependency
+    from json import loads as json_loads
 
 from api.config import settings
 from api.models import (
@@ -10,8 +18,8 @@ from api.models import (
     ServiceStatus,
     ZwiftStatus,
 )
-from api.utils.network import ping_host
-from api.utils.ssh_client import SSHClient
+from api.utils.cache import ttl_cache
+from api.utils.ssh_client import get_ssh_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,93 +28,199 @@ class StatusChecker:
     """Service for checking status of PC, Zwift, and related services."""
 
     def __init__(self):
-        """Initialize status checker with SSH client."""
-        self.ssh = SSHClient(
+        """Initialize status checker with the shared SSH client."""
+        self.ssh = get_ssh_client(
             host=settings.pc_ip,
             username=settings.pc_user,
             key_path=settings.ssh_key_path,
             connect_timeout=settings.ssh_connect_timeout,
         )
+        # Snapshot: avoids a settings descriptor lookup per probe
+        self._pc_ip = settings.pc_ip
 
+    @ttl_cache(seconds=2)
     async def check_pc_online(self) -> PCStatus:
         """
-        Check if PC is online via ping and SSH connectivity.
+        Check if PC is online via a single TCP probe to the SSH port.
+
+        A successful connect to port 22 proves the machine is up and SSH
+        is reachable in one round-trip (no ICMP permissions needed);
+        connection refused means up-but-SSH-down. Results are cached
+        for a couple of seconds so polling bursts (e.g. iOS Shortcuts
+        widgets) reuse one probe.
 
         Returns:
             PCStatus with online status, SSH availability, and response time
         """
-        is_online, response_time_ms = await ping_host(settings.pc_ip, timeout=1)
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(self._pc_ip, 22), timeout=1)
+            response_time_ms = int((loop.time() - start) * 1000)
+            writer.close()
+            return PCStatus(
+                online=True,
+                ssh_available=True,
+                ip_address=self._pc_ip,
+                response_time_ms=response_time_ms,
+            )
+        except ConnectionRefusedError:
+            # The TCP stack answered, so the host is up even though sshd
+            # is not accepting connections
+            return PCStatus(
+                online=True,
+                ssh_available=False,
+                ip_address=self._pc_ip,
+                response_time_ms=int((loop.time() - start) * 1000),
+            )
+        except (asyncio.TimeoutError, OSError):
+            return PCStatus(
+                online=False,
+                ssh_available=False,
+                ip_address=self._pc_ip,
+                response_time_ms=None,
+            )
+
+    async def _check_process(self, process_name: str, include_cpu: bool = False) -> ZwiftStatus:
+        """
+        Check a remote process, preferring the native tasklist query.
 
-        # Only check SSH if ping succeeds
-        ssh_available = False
-        if is_online:
-            ssh_available = await self.ssh.is_available()
+        ``tasklist`` runs under cmd.exe in tens of milliseconds, skipping
+        the PowerShell/.NET cold start entirely, but reports only PID and
+        working set. Callers whose responses expose CPU time pass
+        ``include_cpu=True`` to go straight to the PowerShell probe; it
+        also remains the fallback when tasklist output cannot be parsed.
 
-        return PCStatus(
-            online=is_online,
-            ssh_available=ssh_available,
-            ip_address=settings.pc_ip,
-            response_time_ms=response_time_ms,
-        )
+        Args:
+            process_name: Remote process name (without extension)
+            include_cpu: Require CPU time, skipping the tasklist fast path
 
-    async def check_zwift_running(self) -> ZwiftStatus:
+        Returns:
+            ZwiftStatus (reused model) with process information if running
         """
-        Check if Zwift is running via SSH.
+        if include_cpu:
+            return await self._check_process_powershell(process_name)
+        try:
+            stdout, _, return_code = await self.ssh.execute(
+                f'tasklist /FI "IMAGENAME eq {process_name}.exe" /FO CSV /NH', timeout=10
+            )
+            if return_code == 0:
+                if not stdout.startswith('"'):
+                    # tasklist prints "INFO: No tasks ..." when the
+                    # filter matches nothing, not an empty CSV
+                    return ZwiftStatus(running=False)
+                row = next(csv.reader(StringIO(stdout)))
+                memory_kb = int("".join(ch for ch in row[4] if ch.isdigit()) or 0)
+                return ZwiftStatus(
+                    running=True,
+                    process_id=int(row[1]),
+                    memory_mb=(memory_kb >> 10) if memory_kb else None,
+                )
+        except Exception as e:
+            logger.debug(f"tasklist probe for {process_name} failed, falling back: {e}")
 
-        Returns:
-            ZwiftStatus with process information if running
+        return await self._check_process_powershell(process_name)
 
-        Note:
-            PC must be online for this check to work
+    async def _check_process_powershell(self, process_name: str) -> ZwiftStatus:
+        """
+        Check a remote process via a CSV-formatted PowerShell probe.
+
+        The format-string probe emits ``id,cpu,working_set`` on one
+        line, skipping ConvertTo-Json on the PC and JSON parsing here.
+        Slower than tasklist (runspace start) but includes CPU time.
+
+        Args:
+            process_name: Remote process name (without extension)
+
+        Returns:
+            ZwiftStatus (reused model) with process information if running
         """
         try:
-            script = "Get-Process ZwiftApp -ErrorAction SilentlyContinue | Select-Object Id,CPU,WorkingSet64 | ConvertTo-Json"
+            script = (
+                f"$p = Get-Process {process_name} -ErrorAction SilentlyContinue"
+                " | Select-Object -First 1; "
+                'if ($p) { "{0},{1},{2}" -f $p.Id,$p.CPU,$p.WorkingSet64 }'
+            )
             stdout, stderr, return_code = await self.ssh.execute_powershell(script, timeout=10)
 
             if return_code == 0 and stdout:
-                # Parse JSON output
                 try:
-                    data = json.loads(stdout)
-                    process_id = data.get("Id")
-                    cpu_usage = data.get("CPU")
-                    memory_bytes = data.get("WorkingSet64")
-
+                    pid_str, cpu_str, mem_str = stdout.strip().split(",")
+                    memory_bytes = int(mem_str) if mem_str else None
                     return ZwiftStatus(
                         running=True,
-                        process_id=process_id,
-                        cpu_usage=cpu_usage,
-                        memory_mb=int(memory_bytes / (1024 * 1024)) if memory_bytes else None,
+                        process_id=int(pid_str) if pid_str else None,
+                        cpu_usage=float(cpu_str) if cpu_str else None,
+                        memory_mb=(memory_bytes >> 20) if memory_bytes else None,
                     )
-                except (json.JSONDecodeError, KeyError) as e:
-                    logger.error(f"Failed to parse Zwift process info: {e}")
+                except ValueError as e:
+                    logger.error(f"Failed to parse {process_name} process info: {e}")
 
             return ZwiftStatus(running=False)
 
         except Exception as e:
-            logger.error(f"Error checking Zwift status: {e}")
+            logger.error(f"Error checking {process_name} status: {e}")
             return ZwiftStatus(running=False)
 
+    @ttl_cache(seconds=2)
+    async def check_zwift_running(self) -> ZwiftStatus:
+        """
+        Check if Zwift is running via SSH.
+
+        Results are cached briefly to absorb polling bursts; pass
+        ``force=True`` after a control action to get a fresh probe.
+
+        Returns:
+            ZwiftStatus with process information if running
+
+        Note:
+            PC must be online for this check to work
+        """
+        # The /status/zwift response exposes cpu_usage, which only the
+        # PowerShell probe reports
+        return await self._check_process("ZwiftApp", include_cpu=True)
+
+    @ttl_cache(seconds=2)
     async def check_sunshine_status(self) -> ServiceStatus:
         """
         Check Sunshine service status via SSH.
 
+        Results are cached briefly to absorb polling bursts; pass
+        ``force=True`` after a control action to get a fresh probe.
+
         Returns:
             ServiceStatus for Sunshine service
         """
+        # sc query answers from cmd.exe without a PowerShell runspace;
+        # fall through to the PowerShell probe if its output is unexpected
+        try:
+            stdout, _, return_code = await self.ssh.execute("sc query SunshineService", timeout=10)
+            if return_code == 0 and "STATE" in stdout:
+                # e.g. "        STATE              : 4  RUNNING"
+                state_line = stdout.split("STATE", 1)[1].splitlines()[0]
+                status = state_line.split()[-1].capitalize()
+                return ServiceStatus(
+                    name="SunshineService",
+                    running=(status == "Running"),
+                    status=status,
+                )
+        except Exception as e:
+            logger.debug(f"sc query probe failed, falling back: {e}")
+
         try:
             script = "Get-Service SunshineService -ErrorAction SilentlyContinue | Select-Object @{Name='Status';Expression={$_.Status.ToString()}} | ConvertTo-Json"
             stdout, stderr, return_code = await self.ssh.execute_powershell(script, timeout=10)
 
             if return_code == 0 and stdout:
                 try:
-                    data = json.loads(stdout)
+                    data = json_loads(stdout)
                     status = data.get("Status")
                     return ServiceStatus(
                         name="SunshineService",
                         running=(status == "Running"),
                         status=status,
                     )
-                except (json.JSONDecodeError, KeyError) as e:
+                except (ValueError, KeyError) as e:
                     logger.error(f"Failed to parse Sunshine status: {e}")
 
             return ServiceStatus(name="SunshineService", running=False, status="Unknown")
@@ -115,38 +229,79 @@ class StatusChecker:
             logger.error(f"Error checking Sunshine status: {e}")
             return ServiceStatus(name="SunshineService", running=False, status="Error")
 
+    @ttl_cache(seconds=2)
     async def check_obs_running(self) -> ZwiftStatus:
         """
         Check if OBS is running via SSH.
 
+        Results are cached briefly to absorb polling bursts, and
+        concurrent callers share a single in-flight probe.
+
         Returns:
             ZwiftStatus (reused model) with OBS process information if running
         """
-        try:
-            script = "Get-Process obs64 -ErrorAction SilentlyContinue | Select-Object Id,CPU,WorkingSet64 | ConvertTo-Json"
-            stdout, stderr, return_code = await self.ssh.execute_powershell(script, timeout=10)
+        return await self._check_process("obs64")
 
-            if return_code == 0 and stdout:
-                try:
-                    data = json.loads(stdout)
-                    process_id = data.get("Id")
-                    cpu_usage = data.get("CPU")
-                    memory_bytes = data.get("WorkingSet64")
+    async def _check_detailed_status_batched(
+        self,
+    ) -> Optional[tuple[ZwiftStatus, ServiceStatus, ZwiftStatus]]:
+        """
+        Fetch Zwift, Sunshine, and OBS status in one PowerShell invocation.
 
-                    return ZwiftStatus(
-                        running=True,
-                        process_id=process_id,
-                        cpu_usage=cpu_usage,
-                        memory_mb=int(memory_bytes / (1024 * 1024)) if memory_bytes else None,
-                    )
-                except (json.JSONDecodeError, KeyError) as e:
-                    logger.error(f"Failed to parse OBS process info: {e}")
+        Collapses the three per-probe SSH round-trips (each spawning its
+        own remote PowerShell) into a single composite JSON query.
 
-            return ZwiftStatus(running=False)
+        Returns:
+            Tuple of (zwift, sunshine, obs) statuses, or None if the
+            batched probe failed and the individual probes should run
+        """
+        # -First 1 matches the per-process probes: without it a duplicate
+        # process (e.g. transient during launch) makes ConvertTo-Json emit
+        # an array for that entry instead of an object
+        script = (
+            "$zwift = Get-Process ZwiftApp -ErrorAction SilentlyContinue"
+            " | Select-Object -First 1 Id,CPU,WorkingSet64; "
+            "$obs = Get-Process obs64 -ErrorAction SilentlyContinue"
+            " | Select-Object -First 1 Id,CPU,WorkingSet64; "
+            "$sunshine = Get-Service SunshineService -ErrorAction SilentlyContinue"
+            " | Select-Object @{Name='Status';Expression={$_.Status.ToString()}}; "
+            "@{zwift=$zwift; obs=$obs; sunshine=$sunshine} | ConvertTo-Json -Depth 4"
+        )
 
+        def process_status(entry: Optional[dict]) -> ZwiftStatus:
+            if not entry:
+                return ZwiftStatus(running=False)
+            memory_bytes = entry.get("WorkingSet64")
+            return ZwiftStatus(
+                running=True,
+                process_id=entry.get("Id"),
+                cpu_usage=entry.get("CPU"),
+                memory_mb=(memory_bytes >> 20) if memory_bytes else None,
+            )
+
+        # The model building stays inside the try: any unexpected payload
+        # shape (not just a failed command) must degrade to the fallback
+        # probes rather than propagate out of check_full_status
+        try:
+            stdout, stderr, return_code = await self.ssh.execute_powershell(script, timeout=10)
+            if return_code != 0 or not stdout:
+                return None
+            data = json_loads(stdout)
+            sunshine_entry = data.get("sunshine") or {}
+            status = sunshine_entry.get("Status") if isinstance(sunshine_entry, dict) else None
+            sunshine_status = ServiceStatus(
+                name="SunshineService",
+                running=(status == "Running"),
+                status=status or "Unknown",
+            )
+            return (
+                process_status(data.get("zwift")),
+                sunshine_status,
+                process_status(data.get("obs")),
+            )
         except Exception as e:
-            logger.error(f"Error checking OBS status: {e}")
-            return ZwiftStatus(running=False)
+            logger.debug(f"Batched status probe failed, falling back: {e}")
+            return None
 
     async def check_full_status(self) -> FullStatus:
         """
@@ -164,12 +319,38 @@ class StatusChecker:
         obs_status = None
 
         if pc_status.online and pc_status.ssh_available:
-            try:
-                zwift_status = await self.check_zwift_running()
-                sunshine_status = await self.check_sunshine_status()
-                obs_status = await self.check_obs_running()
-            except Exception as e:
-                logger.error(f"Error checking detailed status: {e}")
+            # Prefer the single batched probe; fall back to the three
+            # individual probes if it fails (e.g. partial JSON)
+            batched = await self._check_detailed_status_batched()
+            if batched is not None:
+                zwift_status, sunshine_status, obs_status = batched
+                return FullStatus(
+                    pc=pc_status,
+                    zwift=zwift_status,
+                    sunshine=sunshine_status,
+                    obs=obs_status,
+                )
+
+            # The three probes are independent, so run them concurrently;
+            # return_exceptions keeps one failed probe from discarding the
+            # results of the other two
+            zwift_status, sunshine_status, obs_status = await asyncio.gather(
+                self.check_zwift_running(),
+                self.check_sunshine_status(),
+                self.check_obs_running(),
+                return_exceptions=True,
+            )
+            if isinstance(zwift_status, BaseException):
+                logger.error(f"Error checking Zwift status: {zwift_status}")
+                zwift_status = ZwiftStatus(running=False)
+            if isinstance(sunshine_status, BaseException):
+                logger.error(f"Error checking Sunshine status: {sunshine_status}")
+                sunshine_status = ServiceStatus(
+                    name="SunshineService", running=False, status="Error"
+                )
+            if isinstance(obs_status, BaseException):
+                logger.error(f"Error checking OBS status: {obs_status}")
+                obs_status = ZwiftStatus(running=False)
 
         return FullStatus(
             pc=pc_status,
@@ -1,7 +1,11 @@
 """Task manager for tracking and executing background tasks."""
 
+import asyncio
 import logging
-from datetime import datetime
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
 
@@ -10,16 +14,58 @@ from api.services.pc_control import PCControlService
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of tasks kept in memory; the least recently used task
+# is evicted first so the store stays bounded on long-running deployments
+MAX_TASKS = 256
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True)
+class _ProgressRecord:
+    """Mutable in-memory progress state for a task."""
+
+    current_step: str = ""
+    step_number: int = 0
+    total_steps: int = 0
+    details: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _TaskRecord:
+    """
+    Internal task state, kept separate from the API model.
+
+    Progress updates mutate plain slotted attributes — no Pydantic
+    validation on the hot path; the response model is only built when a
+    client actually fetches the task.
+    """
+
+    task_id: UUID
+    status: TaskStatus
+    task_type: str
+    progress: _ProgressRecord = field(default_factory=_ProgressRecord)
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=_utcnow)
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
 
 class TaskManager:
     """Manager for background task execution and tracking."""
 
     def __init__(self):
         """Initialize task manager with in-memory task store."""
-        self.tasks: dict[UUID, Task] = {}
+        self.tasks: OrderedDict[UUID, _TaskRecord] = OrderedDict()
+        self._events: dict[UUID, asyncio.Event] = {}
+        self._running: dict[UUID, asyncio.Task] = {}
+        self._queue: asyncio.Queue[tuple[UUID, Callable[[UUID], Awaitable[None]]]] = asyncio.Queue()
+        self._worker_task: Optional[asyncio.Task] = None
         self.pc_control = PCControlService()
 
-    def create_task(self, task_type: str) -> Task:
+    def create_task(self, task_type: str) -> _TaskRecord:
         """
         Create a new task.
 
@@ -27,19 +73,85 @@ class TaskManager:
             task_type: Type of task (start, wake, etc.)
 
         Returns:
-            Created task object
+            Created task record
         """
         task_id = uuid4()
-        task = Task(
+        task = _TaskRecord(
             task_id=task_id,
             status=TaskStatus.PENDING,
             task_type=task_type,
         )
         self.tasks[task_id] = task
-        logger.info(f"Created task {task_id} ({task_type})")
+        self._events[task_id] = asyncio.Event()
+        while len(self.tasks) > MAX_TASKS:
+            victim, _ = self.tasks.popitem(last=False)
+            self._events.pop(victim, None)
+        logger.info("Created task %s (%s)", task_id, task_type)
         return task
 
-    def get_task(self, task_id: UUID) -> Optional[Task]:
+    def launch(self, task_id: UUID, sequence: Callable[[UUID], Awaitable[None]]) -> None:
+        """
+        Queue a sequence coroutine for the background worker.
+
+        A single worker consumes the queue, so concurrent POSTs cannot
+        run overlapping SSH sequences against the one PC — later
+        requests simply wait their turn. The worker is spawned lazily on
+        first use so the manager can be constructed before the event
+        loop exists.
+
+        Args:
+            task_id: Task UUID to track progress
+            sequence: Sequence coroutine function taking the task UUID
+        """
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._worker())
+        self._queue.put_nowait((task_id, sequence))
+
+    async def _worker(self) -> None:
+        """Run queued sequences one at a time."""
+        while True:
+            task_id, sequence = await self._queue.get()
+            try:
+                task = self.tasks.get(task_id)
+                if task is None or task.status is not TaskStatus.PENDING:
+                    # Evicted or cancelled while waiting in the queue
+                    continue
+                runner = asyncio.create_task(sequence(task_id))
+                self._running[task_id] = runner
+                try:
+                    await runner
+                except asyncio.CancelledError:
+                    # Cancelled via cancel_task; keep serving the queue
+                    pass
+                finally:
+                    self._running.pop(task_id, None)
+            finally:
+                self._queue.task_done()
+
+    def cancel_task(self, task_id: UUID) -> bool:
+        """
+        Cancel a running task.
+
+        Args:
+            task_id: Task UUID
+
+        Returns:
+            True if a cancellation was issued, False if the task is not
+            queued or running
+        """
+        task = self.tasks.get(task_id)
+        if not task or task.status not in (TaskStatus.PENDING, TaskStatus.RUNNING):
+            return False
+
+        runner = self._running.get(task_id)
+        if runner is not None:
+            runner.cancel()
+        # A task still waiting in the queue has no runner; marking it
+        # failed makes the worker skip it when its turn comes
+        self.mark_task_failed(task_id, "Task cancelled")
+        return True
+
+    def get_task(self, task_id: UUID) -> Optional[_TaskRecord]:
         """
         Get task by ID.
 
@@ -47,10 +159,72 @@ class TaskManager:
             task_id: Task UUID
 
         Returns:
-            Task object if found, None otherwise
+            Task record if found, None otherwise
         """
+        task = self.tasks.get(task_id)
+        if task is not None:
+            # Touch for LRU: a task still being polled should not be the
+            # first one evicted
+            self.tasks.move_to_end(task_id)
+        return task
+
+    async def wait_for_completion(
+        self, task_id: UUID, timeout: float = 60.0
+    ) -> Optional[_TaskRecord]:
+        """
+        Wait until a task reaches a terminal state or the timeout expires.
+
+        Lets clients long-poll the task endpoint instead of re-requesting
+        every few seconds.
+
+        Args:
+            task_id: Task UUID
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Task record if found, None otherwise
+        """
+        task = self.tasks.get(task_id)
+        if not task:
+            return None
+
+        event = self._events.get(task_id)
+        if event and task.status in (TaskStatus.PENDING, TaskStatus.RUNNING):
+            try:
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
         return self.tasks.get(task_id)
 
+    @staticmethod
+    def to_response(record: _TaskRecord) -> Task:
+        """
+        Build the API Task model from an internal record.
+
+        Args:
+            record: Internal task record
+
+        Returns:
+            Task response model with the record's current state
+        """
+        progress = record.progress
+        return Task(
+            task_id=record.task_id,
+            status=record.status,
+            task_type=record.task_type,
+            progress=TaskProgress(
+                current_step=progress.current_step,
+                step_number=progress.step_number,
+                total_steps=progress.total_steps,
+                details=progress.details,
+            ),
+            error=record.error,
+            created_at=record.created_at,
+            started_at=record.started_at,
+            completed_at=record.completed_at,
+        )
+
     def update_task_progress(
         self,
         task_id: UUID,
@@ -71,38 +245,84 @@ class TaskManager:
         """
         task = self.tasks.get(task_id)
         if task:
-            task.progress = TaskProgress(
-                current_step=step,
-                step_number=step_number,
-                total_steps=total_steps,
-                details=details,
-            )
-            logger.debug(f"Task {task_id} progress: {step} ({step_number}/{total_steps})")
+            progress = task.progress
+            progress.current_step = step
+            progress.step_number = step_number
+            progress.total_steps = total_steps
+            progress.details = details
+            logger.debug("Task %s progress: %s (%s/%s)", task_id, step, step_number, total_steps)
 
     def mark_task_running(self, task_id: UUID) -> None:
         """Mark task as running."""
         task = self.tasks.get(task_id)
         if task:
             task.status = TaskStatus.RUNNING
-            task.started_at = datetime.utcnow()
-            logger.info(f"Task {task_id} started")
+            task.started_at = _utcnow()
+            logger.info("Task %s started", task_id)
 
     def mark_task_completed(self, task_id: UUID) -> None:
         """Mark task as completed."""
         task = self.tasks.get(task_id)
         if task:
             task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.utcnow()
-            logger.info(f"Task {task_id} completed")
+            task.completed_at = _utcnow()
+            self._notify_waiters(task_id)
+            logger.info("Task %s completed", task_id)
 
     def mark_task_failed(self, task_id: UUID, error: str) -> None:
         """Mark task as failed with error message."""
         task = self.tasks.get(task_id)
         if task:
             task.status = TaskStatus.FAILED
-            task.completed_at = datetime.utcnow()
+            task.completed_at = _utcnow()
             task.error = error
-            logger.error(f"Task {task_id} failed: {error}")
+            self._notify_waiters(task_id)
+            logger.error("Task %s failed: %s", task_id, error)
+
+    def _notify_waiters(self, task_id: UUID) -> None:
+        """Wake any clients waiting on this task's completion."""
+        event = self._events.get(task_id)
+        if event:
+            event.set()
+
+    async def _run_steps(
+        self,
+        task_id: UUID,
+        steps: list[tuple[str, Callable[[], Awaitable[object]], Optional[str]]],
+        first_step: int,
+        total_steps: int,
+    ) -> bool:
+        """
+        Run a linear slice of sequence steps, updating progress per step.
+
+        Each entry is ``(label, run, error)``; a step whose result is
+        False fails the task with ``error``, while steps with ``error``
+        set to None are best-effort and never abort the sequence.
+
+        Args:
+            task_id: Task UUID to track progress
+            steps: Ordered (label, coroutine factory, fatal error) tuples
+            first_step: Step number of the first entry
+            total_steps: Total step count reported in progress updates
+
+        Returns:
+            True if every step passed, False if the task was failed
+        """
+        for offset, (label, run, error) in enumerate(steps):
+            self.update_task_progress(task_id, label, first_step + offset, total_steps)
+            result = await run()
+            if error is not None and result is False:
+                self.mark_task_failed(task_id, error)
+                return False
+        return True
+
+    async def _launch_zwift_and_sauce(self) -> bool:
+        """Launch Zwift and Sauce concurrently; only Zwift is fatal."""
+        zwift_launched, _ = await asyncio.gather(
+            self.pc_control.launch_zwift_and_activate(),
+            self.pc_control.launch_sauce(),
+        )
+        return zwift_launched
 
     async def run_start_sequence(self, task_id: UUID) -> None:
         """
@@ -116,69 +336,77 @@ class TaskManager:
         try:
             self.mark_task_running(task_id)
 
-            # Step 1: Send WoL packet
-            self.update_task_progress(task_id, "Sending Wake-on-LAN packet", 1, 9)
-            wol_sent = await self.pc_control.wake_pc()
-            if not wol_sent:
-                self.mark_task_failed(task_id, "Failed to send WoL packet")
-                return
-
-            # Step 2: Wait for network
-            self.update_task_progress(task_id, "Waiting for PC to respond to network", 2, 9)
-            network_available = await self.pc_control.wait_for_network()
-            if not network_available:
-                self.mark_task_failed(task_id, "PC did not respond to network")
+            # Pre-check current state: skip boot steps that are already
+            # satisfied, or the whole sequence if Zwift is up
+            status = await self.pc_control.status_checker.check_full_status()
+            already_online = status.pc.online and status.pc.ssh_available
+            if already_online and status.zwift is not None and status.zwift.running:
+                self.update_task_progress(task_id, "Zwift already running", 7, 7)
+                self.mark_task_completed(task_id)
                 return
 
-            # Step 3: Wait for SSH
-            self.update_task_progress(task_id, "Waiting for SSH to become available", 3, 9)
-            ssh_available = await self.pc_control.wait_for_ssh()
-            if not ssh_available:
-                self.mark_task_failed(task_id, "SSH did not become available")
-                return
-
-            # Step 4: Wait for desktop
-            self.update_task_progress(task_id, "Waiting for Windows desktop to load", 4, 9)
-            desktop_loaded = await self.pc_control.wait_for_desktop()
-            if not desktop_loaded:
-                self.mark_task_failed(task_id, "Windows desktop did not load")
-                return
-
-            # Step 5: Stop Sunshine
-            self.update_task_progress(task_id, "Stopping Sunshine service", 5, 9)
-            await self.pc_control.stop_sunshine()
-
-            # Step 6: Launch Zwift
-            self.update_task_progress(task_id, "Launching Zwift application", 6, 9)
-            zwift_launched = await self.pc_control.launch_zwift()
-            if not zwift_launched:
-                self.mark_task_failed(task_id, "Failed to launch Zwift")
+            if not already_online:
+                # Step 1: Send WoL packet
+                self.update_task_progress(task_id, "Sending Wake-on-LAN packet", 1, 7)
+                wol_sent = await self.pc_control.wake_pc()
+                if not wol_sent:
+                    self.mark_task_failed(task_id, "Failed to send WoL packet")
+                    return
+
+                # Steps 2-3: Race the SSH and desktop waits; desktop
+                # readiness implies SSH, so both probes start the moment
+                # the WoL packet is away and progress advances as each
+                # stage completes
+                self.update_task_progress(task_id, "Waiting for PC (network + SSH)", 2, 7)
+                ssh_task = asyncio.create_task(self.pc_control.wait_for_ssh())
+                desktop_task = asyncio.create_task(self.pc_control.wait_for_desktop())
+                pending = {ssh_task, desktop_task}
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    failed = next((t for t in done if not t.result()), None)
+                    if failed is not None:
+                        for waiter in pending:
+                            waiter.cancel()
+                        await asyncio.gather(*pending, return_exceptions=True)
+                        self.mark_task_failed(
+                            task_id,
+                            "SSH did not become available"
+                            if failed is ssh_task
+                            else "Windows desktop did not load",
+                        )
+                        return
+                    if ssh_task.done() and pending:
+                        self.update_task_progress(
+                            task_id, "Waiting for Windows desktop to load", 3, 7
+                        )
+
+            # Steps 4-7 are linear "update progress, await, maybe fail"
+            # blocks, so they run from a table instead of four copies of
+            # the same scaffolding
+            launch_steps = [
+                # Batched cleanup is best-effort: the launch path copes
+                # with Sunshine or stale processes still being around
+                ("Stopping Sunshine service", self.pc_control.stop_sunshine_and_kill_zwift, None),
+                (
+                    "Launching Zwift and Sauce",
+                    self._launch_zwift_and_sauce,
+                    "Failed to launch Zwift",
+                ),
+                (
+                    "Waiting for Zwift to start",
+                    self.pc_control.wait_for_zwift,
+                    "Zwift did not start",
+                ),
+                ("Setting process priorities", self.pc_control.set_process_priorities, None),
+            ]
+            if not await self._run_steps(task_id, launch_steps, first_step=4, total_steps=7):
                 return
 
-            # Step 6b: Activate Zwift launcher (Tab, Tab, Enter)
-            self.update_task_progress(task_id, "Activating Zwift launcher", 6, 9)
-            await self.pc_control.activate_zwift_launcher()
-
-            # Step 7: Launch Sauce
-            self.update_task_progress(task_id, "Launching Sauce for Zwift", 7, 9)
-            await self.pc_control.launch_sauce()
-
-            # Step 8: Wait for Zwift to start
-            self.update_task_progress(task_id, "Waiting for Zwift to start", 8, 9)
-            zwift_running = await self.pc_control.wait_for_zwift()
-            if not zwift_running:
-                self.mark_task_failed(task_id, "Zwift did not start")
-                return
-
-            # Step 9: Set process priorities
-            self.update_task_progress(task_id, "Setting process priorities", 9, 9)
-            await self.pc_control.set_process_priorities()
-
             # All steps completed
             self.mark_task_completed(task_id)
 
         except Exception as e:
-            logger.exception(f"Unexpected error in start sequence: {e}")
+            logger.exception("Unexpected error in start sequence: %s", e)
             self.mark_task_failed(task_id, f"Unexpected error: {str(e)}")
 
     async def run_wake_sequence(self, task_id: UUID) -> None:
@@ -191,32 +419,28 @@ class TaskManager:
         try:
             self.mark_task_running(task_id)
 
-            # Step 1: Send WoL packet
-            self.update_task_progress(task_id, "Sending Wake-on-LAN packet", 1, 3)
-            wol_sent = await self.pc_control.wake_pc()
-            if not wol_sent:
-                self.mark_task_failed(task_id, "Failed to send WoL packet")
-                return
-
-            # Step 2: Wait for network
-            self.update_task_progress(task_id, "Waiting for PC to respond to network", 2, 3)
-            network_available = await self.pc_control.wait_for_network()
-            if not network_available:
-                self.mark_task_failed(task_id, "PC did not respond to network")
-                return
-
-            # Step 3: Wait for SSH
-            self.update_task_progress(task_id, "Waiting for SSH to become available", 3, 3)
-            ssh_available = await self.pc_control.wait_for_ssh()
-            if not ssh_available:
-                self.mark_task_failed(task_id, "SSH did not become available")
+            # SSH readiness implies network readiness, so two steps cover
+            # the whole wake
+            wake_steps = [
+                (
+                    "Sending Wake-on-LAN packet",
+                    self.pc_control.wake_pc,
+                    "Failed to send WoL packet",
+                ),
+                (
+                    "Waiting for PC (network + SSH)",
+                    self.pc_control.wait_for_ssh,
+                    "SSH did not become available",
+                ),
+            ]
+            if not await self._run_steps(task_id, wake_steps, first_step=1, total_steps=2):
                 return
 
             # All steps completed
             self.mark_task_completed(task_id)
 
         except Exception as e:
-            logger.exception(f"Unexpected error in wake sequence: {e}")
+            logger.exception("Unexpected error in wake sequence: %s", e)
             self.mark_task_failed(task_id, f"Unexpected error: {str(e)}")
 
 
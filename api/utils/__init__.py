@@ -5,4 +5,5 @@ This package contains low-level utility implementations:
 - ssh_client: Async SSH client for remote command execution
 - wol: Wake-on-LAN magic packet sender
 - network: Network connectivity and status utilities
+- cache: TTL caching for async status probes
 """
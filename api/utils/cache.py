@@ -0,0 +1,68 @@
+"""TTL caching with request coalescing for async status probes."""
+
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Optional
+
+
+class _CacheEntry:
+    """Cached value plus in-flight probe state for one method."""
+
+    __slots__ = ("expiry", "value", "inflight", "lock")
+
+    def __init__(self):
+        self.expiry = 0.0
+        self.value: Any = None
+        self.inflight: Optional[asyncio.Task] = None
+        self.lock = asyncio.Lock()
+
+
+def ttl_cache(seconds: float = 2.0) -> Callable:
+    """
+    Cache the result of a zero-argument async method for a short TTL.
+
+    Burst callers within the TTL reuse the cached result, and callers
+    arriving while a probe is already in flight await the same probe
+    instead of starting their own. Pass ``force=True`` to bypass a
+    cached value when freshness matters (e.g. right after a control
+    action).
+
+    Args:
+        seconds: Time in seconds a result stays fresh
+
+    Returns:
+        Decorator for async methods taking no arguments
+    """
+
+    def decorator(func: Callable) -> Callable:
+        attr = f"_ttl_cache_{func.__name__}"
+
+        async def _probe(self, entry: _CacheEntry) -> Any:
+            try:
+                value = await func(self)
+                entry.value = value
+                entry.expiry = time.monotonic() + seconds
+                return value
+            finally:
+                entry.inflight = None
+
+        @functools.wraps(func)
+        async def wrapper(self, *, force: bool = False) -> Any:
+            entry = getattr(self, attr, None)
+            if entry is None:
+                entry = _CacheEntry()
+                setattr(self, attr, entry)
+
+            async with entry.lock:
+                if not force and time.monotonic() < entry.expiry:
+                    return entry.value
+                if entry.inflight is None:
+                    entry.inflight = asyncio.create_task(_probe(self, entry))
+                task = entry.inflight
+
+            return await task
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,31 @@
+"""Cached UTC clock for high-frequency timestamp defaults."""
+
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+# Refresh granularity in seconds; status payload timestamps do not need
+# sub-100ms resolution
+_RESOLUTION = 0.1
+
+_cached_at = 0.0
+_cached: Optional[datetime] = None
+
+
+def now_utc() -> datetime:
+    """
+    Return the current UTC time, cached for up to 100ms.
+
+    Avoids a clock syscall and datetime allocation for every response
+    model constructed during polling bursts. Use datetime directly
+    where exact timestamps matter (e.g. task completion times).
+
+    Returns:
+        Cached timezone-aware UTC datetime
+    """
+    global _cached_at, _cached
+    mono = time.monotonic()
+    if _cached is None or mono - _cached_at >= _RESOLUTION:
+        _cached = datetime.now(timezone.utc)
+        _cached_at = mono
+    return _cached
@@ -2,105 +2,108 @@
 
 import asyncio
 import logging
+import random
+import socket
 import time
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-async def send_wol_packet(mac_address: str) -> bool:
+def _send_wol_sync(packet: bytes) -> None:
+    """Broadcast the magic packet on a short-lived UDP socket."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.sendto(packet, ("255.255.255.255", 9))
+
+
+async def send_wol_packet(packet: bytes) -> bool:
     """
-    Send Wake-on-LAN magic packet to the specified MAC address.
+    Send a Wake-on-LAN magic packet via UDP broadcast.
+
+    Sends the precomputed packet (see Settings.wol_packet) directly from
+    this process instead of spawning the wakeonlan binary; the socket
+    work runs in the default executor so the event loop never blocks on
+    socket creation or name resolution.
 
     Args:
-        mac_address: MAC address in format XX:XX:XX:XX:XX:XX
+        packet: Magic packet bytes to broadcast
 
     Returns:
         True if WoL packet was sent successfully, False otherwise
     """
     try:
-        process = await asyncio.create_subprocess_exec(
-            "wakeonlan",
-            mac_address,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-
-        if process.returncode == 0:
-            logger.info(f"WoL packet sent to {mac_address}")
-            return True
-        else:
-            logger.error(f"Failed to send WoL packet: {stderr.decode().strip()}")
-            return False
-    except FileNotFoundError:
-        logger.error("wakeonlan command not found. Install with: apt-get install wakeonlan")
-        return False
+        await asyncio.get_running_loop().run_in_executor(None, _send_wol_sync, packet)
+        logger.info("WoL magic packet sent")
+        return True
     except Exception as e:
         logger.error(f"Error sending WoL packet: {e}")
         return False
 
 
-async def ping_host(ip_address: str, timeout: int = 1) -> tuple[bool, Optional[int]]:
+async def ping_host(
+    ip_address: str, timeout: int = 1, port: int = 22
+) -> tuple[bool, Optional[int]]:
     """
-    Ping a host to check if it's online.
+    Check whether a host is online via a TCP connect probe.
+
+    A plain async connect to the SSH port (the port every later step
+    needs anyway) costs one socket per probe — no ICMP permissions, no
+    subprocess fork. A refused connection still proves the host is up.
 
     Args:
-        ip_address: IP address to ping
-        timeout: Ping timeout in seconds
+        ip_address: IP address to probe
+        timeout: Connect timeout in seconds
+        port: TCP port to probe
 
     Returns:
         Tuple of (is_online, response_time_ms)
     """
+    loop = asyncio.get_event_loop()
+    start = loop.time()
     try:
-        start_time = time.time()
-        process = await asyncio.create_subprocess_exec(
-            "ping",
-            "-c",
-            "1",
-            "-W",
-            str(timeout),
-            ip_address,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-        elapsed_ms = int((time.time() - start_time) * 1000)
-
-        if process.returncode == 0:
-            logger.debug(f"Ping to {ip_address} successful ({elapsed_ms}ms)")
-            return True, elapsed_ms
-        else:
-            logger.debug(f"Ping to {ip_address} failed")
-            return False, None
-    except Exception as e:
-        logger.error(f"Error pinging {ip_address}: {e}")
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip_address, port), timeout)
+        elapsed_ms = int((loop.time() - start) * 1000)
+        writer.close()
+        logger.debug(f"TCP probe to {ip_address}:{port} successful ({elapsed_ms}ms)")
+        return True, elapsed_ms
+    except ConnectionRefusedError:
+        # The TCP stack answered, so the host is up even though the
+        # port is closed
+        return True, int((loop.time() - start) * 1000)
+    except (asyncio.TimeoutError, OSError):
+        logger.debug(f"TCP probe to {ip_address}:{port} failed")
         return False, None
 
 
-async def wait_for_ping(ip_address: str, timeout: int = 120, check_interval: int = 2) -> bool:
+async def wait_for_ping(ip_address: str, timeout: int = 120, check_interval: float = 2) -> bool:
     """
     Wait for a host to respond to ping.
 
     Args:
         ip_address: IP address to ping
         timeout: Maximum time to wait in seconds
-        check_interval: Time between ping attempts in seconds
+        check_interval: Maximum time between ping attempts in seconds
 
     Returns:
         True if host responded within timeout, False otherwise
     """
     logger.info(f"Waiting for {ip_address} to respond to ping (timeout: {timeout}s)...")
-    start_time = time.time()
+    start_time = time.monotonic()
 
-    while time.time() - start_time < timeout:
+    # Exponential backoff with jitter: probe quickly at first so the
+    # success is noticed soon after the host comes up, easing off toward
+    # check_interval as the wait drags on
+    delay = 0.1
+    while time.monotonic() - start_time < timeout:
         is_online, _ = await ping_host(ip_address)
         if is_online:
-            elapsed = int(time.time() - start_time)
+            elapsed = int(time.monotonic() - start_time)
             logger.info(f"{ip_address} is online (took {elapsed}s)")
             return True
 
-        await asyncio.sleep(check_interval)
+        await asyncio.sleep(delay + random.uniform(0, 0.1 * delay))
+        delay = min(check_interval, delay * 1.5)
 
     logger.warning(f"{ip_address} did not respond within {timeout}s")
     return False
@@ -0,0 +1,51 @@
+"""Reusable exponential-backoff polling helper."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class Poller:
+    """
+    Polls an async predicate with exponential backoff until it passes.
+
+    Encapsulates the poll/sleep/back-off loop used while waiting on the
+    remote PC, so services describe only the probe and the timeout; tests
+    can swap in a single-shot poller and skip the waiting entirely.
+    """
+
+    def __init__(self, initial_delay: float = 0.5, max_delay: float = 3.0, factor: float = 1.5):
+        """
+        Initialize the poller's backoff schedule.
+
+        Args:
+            initial_delay: Delay after the first failed probe in seconds
+            max_delay: Ceiling for the backoff delay in seconds
+            factor: Multiplier applied to the delay after each failure
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+
+    async def wait_until(self, check: Callable[[], Awaitable[bool]], timeout: float) -> bool:
+        """
+        Poll ``check`` until it returns True or the timeout expires.
+
+        Args:
+            check: Async predicate probed on each iteration
+            timeout: Maximum time to keep polling in seconds
+
+        Returns:
+            True if the predicate passed within the timeout
+        """
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        delay = self.initial_delay
+        while (loop.time() - start) < timeout:
+            if await check():
+                return True
+            await asyncio.sleep(delay)
+            delay = min(delay * self.factor, self.max_delay)
+        return False
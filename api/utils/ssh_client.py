@@ -1,14 +1,49 @@
 """Async SSH client wrapper using asyncssh."""
 
 import asyncio
+import base64
+import functools
 import logging
 import os
+import random
+import socket
 import time
+from typing import TYPE_CHECKING, Optional
 
-import asyncssh
+if TYPE_CHECKING:
+    import asyncssh
 
 logger = logging.getLogger(__name__)
 
+# Sentinel line emitted after each script in the persistent PowerShell
+# stream; the digits appended to it carry the script's success flag
+_STREAM_SENTINEL = "---PS-DONE---"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_key(path: str):
+    """
+    Load and parse a private key, memoized per path.
+
+    Every client and reconnect shares one parsed SSHKey object instead
+    of re-reading and re-decoding the file. An unreadable key falls back
+    to the expanded path so asyncssh surfaces the error at connect time.
+
+    Args:
+        path: Path to the SSH private key
+
+    Returns:
+        Parsed asyncssh key, or the expanded path string on failure
+    """
+    import asyncssh
+
+    expanded = os.path.expanduser(path)
+    try:
+        return asyncssh.read_private_key(expanded)
+    except (OSError, asyncssh.KeyImportError) as e:
+        logger.warning(f"Could not preload SSH key {expanded}: {e}")
+        return expanded
+
 
 class SSHClient:
     """Async SSH client for remote command execution."""
@@ -33,14 +68,95 @@ class SSHClient:
         self.username = username
         self.key_path = os.path.expanduser(key_path)
         self.connect_timeout = connect_timeout
+        self._conn: Optional[asyncssh.SSHClientConnection] = None
+        self._conn_lock = asyncio.Lock()
+        self._ps_exe: Optional[str] = None
+        self._ps_proc: Optional[asyncssh.SSHClientProcess] = None
+        self._ps_proc_lock = asyncio.Lock()
 
-    async def execute(self, command: str, timeout: int = 30) -> tuple[str, str, int]:
+    async def __aenter__(self) -> "SSHClient":
+        """Enter a connection scope; the connection itself is opened lazily."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the shared connection when the scope ends."""
+        await self.close()
+
+    async def _get_conn(self) -> "asyncssh.SSHClientConnection":
+        """
+        Return the shared SSH connection, reconnecting if needed.
+
+        asyncssh multiplexes concurrent command channels over a single
+        connection, so every command reuses one authenticated session
+        instead of paying TCP + key exchange + auth per call.
+
+        Returns:
+            Open SSH connection to the PC
+        """
+        # Deferred import: asyncssh pulls in ~200ms of crypto dependencies,
+        # so it is only paid on the first SSH command, not at app startup
+        import asyncssh
+
+        async with self._conn_lock:
+            if self._conn is None or self._conn.is_closed():
+                # SECURITY WARNING: Host key verification is DISABLED
+                # This makes the connection vulnerable to Man-in-the-Middle attacks.
+                # Acceptable ONLY because:
+                # 1. Local network environment (home LAN)
+                # 2. Static IP reduces spoofing risk
+                # 3. SSH public key authentication (not password)
+                # For production: Enable host key verification
+                self._conn = await asyncssh.connect(
+                    self.host,
+                    username=self.username,
+                    client_keys=[_load_key(self.key_path)],
+                    # Key auth only: skip the agent-socket probe and any
+                    # other auth methods the server might offer
+                    agent_path=None,
+                    preferred_auth="publickey",
+                    known_hosts=None,  # Disable host key checking (local network)
+                    connect_timeout=self.connect_timeout,
+                    # Keepalives detect a dead PC (sleep, reboot) within
+                    # ~45s instead of waiting for a command to hang
+                    keepalive_interval=15,
+                    keepalive_count_max=3,
+                )
+                # Small command writes should not sit in Nagle's buffer
+                # waiting on a delayed ACK (~40ms stall per write)
+                sock = self._conn.get_extra_info("socket")
+                if sock is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                logger.debug(f"Established SSH connection to {self.host}")
+            return self._conn
+
+    def _invalidate_conn(self) -> None:
+        """Drop the cached connection so the next command reconnects."""
+        self._ps_proc = None  # channel dies with the connection
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            conn.close()
+
+    async def close(self) -> None:
+        """Close the shared SSH connection if one is open."""
+        async with self._conn_lock:
+            self._ps_proc = None
+            conn, self._conn = self._conn, None
+            if conn is not None and not conn.is_closed():
+                conn.close()
+                await conn.wait_closed()
+
+    async def execute(
+        self, command: str, timeout: int = 30, capture: bool = True
+    ) -> tuple[str, str, int]:
         """
         Execute a command via SSH.
 
         Args:
             command: Command to execute
             timeout: Command execution timeout in seconds
+            capture: When False, remote output drains to DEVNULL instead
+                of being buffered and decoded; only the exit status is
+                meaningful for such fire-and-forget commands
 
         Returns:
             Tuple of (stdout, stderr, return_code)
@@ -48,23 +164,20 @@ class SSHClient:
         Raises:
             asyncssh.Error: If SSH connection or command execution fails
         """
-        try:
-            # SECURITY WARNING: Host key verification is DISABLED
-            # This makes the connection vulnerable to Man-in-the-Middle attacks.
-            # Acceptable ONLY because:
-            # 1. Local network environment (home LAN)
-            # 2. Static IP reduces spoofing risk
-            # 3. SSH public key authentication (not password)
-            # For production: Enable host key verification
-            async with asyncssh.connect(
-                self.host,
-                username=self.username,
-                client_keys=[self.key_path],
-                known_hosts=None,  # Disable host key checking (local network)
-                connect_timeout=self.connect_timeout,
-            ) as conn:
+        import asyncssh
+
+        run_kwargs: dict = {"check": False}
+        if not capture:
+            run_kwargs["stdout"] = asyncssh.DEVNULL
+            run_kwargs["stderr"] = asyncssh.DEVNULL
+
+        # One retry on a connection-level error: the cached connection
+        # may have died since the last command (PC reboot, idle drop)
+        for attempt in (1, 2):
+            try:
+                conn = await self._get_conn()
                 logger.debug(f"Executing SSH command: {command[:100]}...")
-                result = await asyncio.wait_for(conn.run(command, check=False), timeout=timeout)
+                result = await asyncio.wait_for(conn.run(command, **run_kwargs), timeout=timeout)
 
                 stdout = result.stdout.strip() if result.stdout else ""
                 stderr = result.stderr.strip() if result.stderr else ""
@@ -77,15 +190,35 @@ class SSHClient:
 
                 return stdout, stderr, return_code
 
-        except asyncio.TimeoutError:
-            logger.error(f"SSH command timed out after {timeout}s")
-            raise
-        except asyncssh.Error as e:
-            logger.error(f"SSH error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error executing SSH command: {e}")
-            raise
+            except asyncio.TimeoutError:
+                logger.error(f"SSH command timed out after {timeout}s")
+                raise
+            except asyncssh.Error as e:
+                self._invalidate_conn()
+                if attempt == 2:
+                    logger.error(f"SSH error: {e}")
+                    raise
+                logger.debug(f"SSH error ({e}); reconnecting and retrying once")
+            except Exception as e:
+                logger.error(f"Unexpected error executing SSH command: {e}")
+                self._invalidate_conn()
+                raise
+
+    async def _powershell_exe(self) -> str:
+        """
+        Return the remote PowerShell executable, probed once per client.
+
+        Prefers pwsh (PowerShell 7) for its much faster cold start,
+        falling back to Windows PowerShell where it is not installed.
+
+        Returns:
+            Executable name to prefix PowerShell commands with
+        """
+        if self._ps_exe is None:
+            _, _, return_code = await self.execute("where pwsh", timeout=10)
+            self._ps_exe = "pwsh" if return_code == 0 else "powershell"
+            logger.info(f"Using {self._ps_exe} for remote PowerShell commands")
+        return self._ps_exe
 
     async def execute_powershell(self, script: str, timeout: int = 30) -> tuple[str, str, int]:
         """
@@ -98,11 +231,81 @@ class SSHClient:
         Returns:
             Tuple of (stdout, stderr, return_code)
         """
-        # Escape quotes and wrap in powershell command
-        escaped_script = script.replace('"', '\\"')
-        command = f'powershell -command "{escaped_script}"'
+        # Ship the script as a base64 -EncodedCommand payload: no shell
+        # quote escaping, no profile load, no interactive module scan
+        encoded = base64.b64encode(script.encode("utf-16-le")).decode("ascii")
+        ps_exe = await self._powershell_exe()
+        command = f"{ps_exe} -NoProfile -NonInteractive -EncodedCommand {encoded}"
         return await self.execute(command, timeout)
 
+    async def _get_ps_process(self) -> "asyncssh.SSHClientProcess":
+        """
+        Return the persistent remote PowerShell process, starting it if needed.
+
+        The process reads commands from stdin (``-Command -``), so one
+        runspace serves every streamed script instead of paying the
+        PowerShell cold start (~1-2s on Windows) per invocation.
+
+        Returns:
+            Running remote PowerShell process
+        """
+        if self._ps_proc is None or self._ps_proc.exit_status is not None:
+            conn = await self._get_conn()
+            ps_exe = await self._powershell_exe()
+            self._ps_proc = await conn.create_process(
+                f"{ps_exe} -NoProfile -NonInteractive -Command -"
+            )
+            logger.debug("Started persistent remote PowerShell runspace")
+        return self._ps_proc
+
+    async def execute_powershell_stream(
+        self, script: str, timeout: int = 30
+    ) -> tuple[str, str, int]:
+        """
+        Execute a PowerShell script in the persistent remote runspace.
+
+        The script is shipped as one base64 line into the long-lived
+        ``-Command -`` process, followed by a sentinel carrying the
+        success flag; output is read back until the sentinel appears.
+        Best suited to the polling probes that run many scripts in a
+        burst. Falls back to :meth:`execute_powershell` if the stream
+        breaks. Scripts must not call ``exit`` (it would terminate the
+        shared runspace); stderr is not captured separately.
+
+        Args:
+            script: PowerShell script to execute
+            timeout: Per-script timeout in seconds
+
+        Returns:
+            Tuple of (stdout, stderr, return_code); stderr is always empty
+        """
+        encoded = base64.b64encode(script.encode("utf-16-le")).decode("ascii")
+        line = (
+            "Invoke-Expression ([Text.Encoding]::Unicode.GetString("
+            f"[Convert]::FromBase64String('{encoded}'))); "
+            f'Write-Output "{_STREAM_SENTINEL}$(if ($?) {{0}} else {{1}})"\n'
+        )
+        async with self._ps_proc_lock:
+            try:
+                proc = await self._get_ps_process()
+                proc.stdin.write(line)
+                output_lines = []
+                while True:
+                    out = await asyncio.wait_for(proc.stdout.readline(), timeout=timeout)
+                    if not out:
+                        raise ConnectionError("Persistent PowerShell process closed its output")
+                    if out.startswith(_STREAM_SENTINEL):
+                        return_code = int(out[len(_STREAM_SENTINEL) :].strip() or 0)
+                        break
+                    output_lines.append(out)
+                return "".join(output_lines).strip(), "", return_code
+            except Exception as e:
+                logger.debug(f"PowerShell stream failed ({e}); falling back to one-shot")
+                proc, self._ps_proc = self._ps_proc, None
+                if proc is not None:
+                    proc.close()
+        return await self.execute_powershell(script, timeout)
+
     async def is_available(self) -> bool:
         """
         Check if SSH is available on the host.
@@ -111,49 +314,80 @@ class SSHClient:
             True if SSH connection succeeds, False otherwise
         """
         try:
-            # SECURITY WARNING: Host key verification is DISABLED
-            # This makes the connection vulnerable to Man-in-the-Middle attacks.
-            # Acceptable ONLY because:
-            # 1. Local network environment (home LAN)
-            # 2. Static IP reduces spoofing risk
-            # 3. SSH public key authentication (not password)
-            # For production: Enable host key verification
-            async with asyncssh.connect(
-                self.host,
-                username=self.username,
-                client_keys=[self.key_path],
-                known_hosts=None,  # Disable host key checking (local network)
-                connect_timeout=self.connect_timeout,
-            ) as conn:
-                # Just test connection
-                await conn.run("echo test", check=False)
-                logger.debug(f"SSH connection to {self.host} successful")
-                return True
+            conn = await self._get_conn()
+            # Just test the connection with a trivial command
+            await conn.run("echo test", check=False)
+            logger.debug(f"SSH connection to {self.host} successful")
+            return True
         except Exception as e:
             logger.debug(f"SSH not available on {self.host}: {e}")
+            self._invalidate_conn()
             return False
 
-    async def wait_for_availability(self, timeout: int = 60, check_interval: int = 2) -> bool:
+    async def wait_for_availability(
+        self,
+        timeout: int = 60,
+        check_interval: float = 2,
+        connect_timeout: Optional[int] = None,
+    ) -> bool:
         """
         Wait for SSH to become available.
 
         Args:
             timeout: Maximum time to wait in seconds
-            check_interval: Time between connection attempts in seconds
+            check_interval: Maximum time between connection attempts in seconds
+            connect_timeout: Per-attempt connect timeout while waiting;
+                probes against a booting host fail fast with a short one
 
         Returns:
             True if SSH became available within timeout, False otherwise
         """
         logger.info(f"Waiting for SSH on {self.host} (timeout: {timeout}s)...")
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        while time.time() - start_time < timeout:
-            if await self.is_available():
-                elapsed = int(time.time() - start_time)
-                logger.info(f"SSH available on {self.host} (took {elapsed}s)")
-                return True
+        original_connect_timeout = self.connect_timeout
+        if connect_timeout is not None:
+            self.connect_timeout = connect_timeout
+        try:
+            # Exponential backoff with jitter, capped at check_interval
+            # (mirrors wait_for_ping)
+            delay = 0.1
+            while time.monotonic() - start_time < timeout:
+                if await self.is_available():
+                    elapsed = int(time.monotonic() - start_time)
+                    logger.info(f"SSH available on {self.host} (took {elapsed}s)")
+                    return True
 
-            await asyncio.sleep(check_interval)
+                await asyncio.sleep(delay + random.uniform(0, 0.1 * delay))
+                delay = min(check_interval, delay * 1.5)
+        finally:
+            self.connect_timeout = original_connect_timeout
 
         logger.warning(f"SSH did not become available within {timeout}s")
         return False
+
+
+@functools.lru_cache(maxsize=4)
+def get_ssh_client(
+    host: str,
+    username: str,
+    key_path: str = "~/.ssh/id_rsa",
+    connect_timeout: int = 10,
+) -> SSHClient:
+    """
+    Return a shared SSHClient for the given connection parameters.
+
+    Every service talks to the same PC, so sharing one client lets them
+    multiplex commands over a single authenticated connection instead of
+    each holding their own.
+
+    Args:
+        host: Remote host IP or hostname
+        username: SSH username
+        key_path: Path to SSH private key
+        connect_timeout: Connection timeout in seconds
+
+    Returns:
+        Shared SSHClient instance for these parameters
+    """
+    return SSHClient(host, username, key_path=key_path, connect_timeout=connect_timeout)
@@ -3,13 +3,17 @@
 from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from api.config import Settings
 from api.main import app
+from api.models import PCStatus, ZwiftStatus
+from api.services.task_manager import task_manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings():
     """Create test settings with mock values."""
     return Settings(
@@ -28,10 +32,106 @@ def test_settings():
     )
 
 
-@pytest.fixture
+def async_return(value):
+    """Build a coroutine function that returns ``value``.
+
+    Stands in for AsyncMock(return_value=...) where a test only needs a
+    fixed async result; a plain closure skips the mock machinery that
+    AsyncMock constructs per instance.
+    """
+
+    async def _f(*args, **kwargs):
+        return value
+
+    return _f
+
+
+# Canonical status models shared across the session. The endpoint tests
+# only read these, and the literal field values are known-valid, so
+# model_construct skips the validation pass entirely (defaults,
+# including the timestamp factory, are still applied).
+
+
+@pytest.fixture(scope="session")
+def pc_online():
+    """PCStatus for a booted PC with SSH reachable."""
+    return PCStatus.model_construct(
+        online=True,
+        ssh_available=True,
+        ip_address="192.168.1.194",
+        response_time_ms=5,
+    )
+
+
+@pytest.fixture(scope="session")
+def pc_offline():
+    """PCStatus for a powered-off PC."""
+    return PCStatus.model_construct(
+        online=False,
+        ssh_available=False,
+        ip_address="192.168.1.194",
+        response_time_ms=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def pc_ssh_unavailable():
+    """PCStatus for a PC answering ping but not SSH."""
+    return PCStatus.model_construct(
+        online=True,
+        ssh_available=False,
+        ip_address="192.168.1.194",
+        response_time_ms=5,
+    )
+
+
+@pytest.fixture(scope="session")
+def zwift_running():
+    """ZwiftStatus for a running Zwift process."""
+    return ZwiftStatus.model_construct(
+        running=True,
+        process_id=12345,
+        cpu_usage=4500.0,
+        memory_mb=1024,
+    )
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create FastAPI test client."""
-    return TestClient(app)
+    """Create a FastAPI test client shared across the session.
+
+    Building a TestClient spins up the ASGI transport; endpoint tests
+    are read-only against the app object, so one client serves them all.
+    The context manager runs the app lifespan exactly once per session
+    (per xdist worker) instead of never, matching production startup.
+    """
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def reset_app_state():
+    """Clear the global task manager's state between tests.
+
+    Endpoint tests normally mock the task manager, but anything that
+    reaches the real one must not leak tasks into later tests.
+    """
+    yield
+    task_manager.tasks.clear()
+    task_manager._events.clear()
+    task_manager._running.clear()
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def aclient():
+    """Create an async test client speaking ASGI directly.
+
+    Unlike TestClient, requests stay on the test's event loop instead
+    of bridging into a worker thread, so async tests can await the app
+    without a thread hop per request.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
 
 
 @pytest.fixture
@@ -4,21 +4,113 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from api.models import FullStatus, PCStatus, ZwiftStatus
+from api.services import pc_control as pc_control_module
 from api.services.pc_control import PCControlService
+from api.utils.ssh_client import get_ssh_client
 
 
-@pytest.fixture
+def mock_precheck(service, online=False, zwift_running=False):
+    """Mock the start-sequence pre-check with the given PC/Zwift state."""
+    service.status_checker.check_full_status = AsyncMock(
+        return_value=FullStatus(
+            pc=PCStatus(online=online, ssh_available=online, ip_address="192.168.1.100"),
+            zwift=ZwiftStatus(running=zwift_running) if online else None,
+        )
+    )
+
+
+# Every step of the full start sequence, in order; used to mock the
+# whole sequence in one call instead of nine hand-written assignments
+SEQUENCE_STEPS = (
+    "wake_pc",
+    "wait_for_ssh",
+    "wait_for_desktop",
+    "stop_sunshine_and_kill_zwift",
+    "launch_zwift_and_activate",
+    "launch_sauce",
+    "wait_for_zwift",
+    "set_process_priorities",
+)
+
+
+# Exact command the launcher activation should issue first; an equality
+# check against this is one pass over the string and catches any drift
+# in the command, unlike a substring probe
+EXPECTED_LAUNCHER_COMMAND = 'schtasks /Run /TN "ZwiftLauncherKeys"'
+
+
+class InstantPoller:
+    """Single-shot poller: probe once, never sleep."""
+
+    async def wait_until(self, check, timeout):
+        return bool(await check())
+
+
+def mock_all_steps(service, **overrides):
+    """Mock the pre-check and every sequence step, defaulting to success."""
+    mock_precheck(service)
+    for name in SEQUENCE_STEPS:
+        default = (True, True) if name == "stop_sunshine_and_kill_zwift" else True
+        setattr(service, name, AsyncMock(return_value=overrides.get(name, default)))
+
+
+@pytest.fixture(scope="session")
 def pc_control_service(test_settings):
-    """Create PCControlService instance with test settings."""
+    """Create a PCControlService instance shared across the session.
+
+    Constructing the service (and its SSH client) once amortizes the
+    setup cost over the whole file; the autouse reset fixture below
+    undoes per-test mocking between tests.
+    """
+    # Clear the shared-client cache so the service gets a fresh SSHClient
+    # rather than one carrying mocks from another test module
+    get_ssh_client.cache_clear()
     with patch("api.services.pc_control.settings", test_settings):
         service = PCControlService()
-        return service
+    # Allocate the SSH mocks once; tests configure return_value or
+    # side_effect on these instead of building a new AsyncMock each
+    service.ssh.execute = AsyncMock()
+    service.ssh.execute_powershell = AsyncMock()
+    service.ssh.execute_powershell_stream = AsyncMock()
+    service.ssh.wait_for_availability = AsyncMock()
+    yield service
+
+
+@pytest.fixture(autouse=True)
+def reset_pc_control_service(pc_control_service):
+    """Restore the shared service to a clean state around each test.
+
+    The shared SSH mocks are cleared of configuration and call history
+    before each test; tests that mock by assigning instance attributes
+    (shadowing the bound methods) are undone afterwards by restoring
+    the snapshotted instance dicts.
+    """
+    ssh = pc_control_service.ssh
+    for mock in (
+        ssh.execute,
+        ssh.execute_powershell,
+        ssh.execute_powershell_stream,
+        ssh.wait_for_availability,
+    ):
+        mock.reset_mock(return_value=True, side_effect=True)
+    service_state = dict(vars(pc_control_service))
+    checker_state = dict(vars(pc_control_service.status_checker))
+    ssh_state = dict(vars(ssh))
+    yield
+    pc_control_service.__dict__.clear()
+    pc_control_service.__dict__.update(service_state)
+    pc_control_service.status_checker.__dict__.clear()
+    pc_control_service.status_checker.__dict__.update(checker_state)
+    pc_control_service.ssh.__dict__.clear()
+    pc_control_service.ssh.__dict__.update(ssh_state)
 
 
-@pytest.mark.asyncio
 async def test_wake_pc_success(pc_control_service):
     """Test successful WoL packet sending."""
-    with patch("api.services.pc_control.send_wol_packet") as mock_wol:
+    # patch.object on the imported module skips the dotted-name
+    # resolution that string-target patching repeats on every entry
+    with patch.object(pc_control_module, "send_wol_packet") as mock_wol:
         mock_wol.return_value = True
 
         result = await pc_control_service.wake_pc()
@@ -27,10 +119,9 @@ async def test_wake_pc_success(pc_control_service):
         mock_wol.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_wake_pc_failure(pc_control_service):
     """Test WoL packet sending failure."""
-    with patch("api.services.pc_control.send_wol_packet") as mock_wol:
+    with patch.object(pc_control_module, "send_wol_packet") as mock_wol:
         mock_wol.return_value = False
 
         result = await pc_control_service.wake_pc()
@@ -38,22 +129,9 @@ async def test_wake_pc_failure(pc_control_service):
         assert result is False
 
 
-@pytest.mark.asyncio
-async def test_wait_for_network_success(pc_control_service):
-    """Test successful network availability wait."""
-    with patch("api.services.pc_control.wait_for_ping") as mock_wait:
-        mock_wait.return_value = True
-
-        result = await pc_control_service.wait_for_network()
-
-        assert result is True
-        mock_wait.assert_called_once()
-
-
-@pytest.mark.asyncio
 async def test_wait_for_ssh_success(pc_control_service):
     """Test successful SSH availability wait."""
-    pc_control_service.ssh.wait_for_availability = AsyncMock(return_value=True)
+    pc_control_service.ssh.wait_for_availability.return_value = True
 
     result = await pc_control_service.wait_for_ssh()
 
@@ -61,97 +139,107 @@ async def test_wait_for_ssh_success(pc_control_service):
     pc_control_service.ssh.wait_for_availability.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_wait_for_desktop_success(pc_control_service):
     """Test successful desktop load detection."""
-    pc_control_service.ssh.execute_powershell = AsyncMock(return_value=("explorer.exe", "", 0))
+    pc_control_service.ssh.execute_powershell_stream.return_value = ("explorer.exe", "", 0)
 
     result = await pc_control_service.wait_for_desktop()
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_wait_for_desktop_timeout(pc_control_service):
     """Test desktop load timeout."""
     # Mock empty output (explorer not found)
-    pc_control_service.ssh.execute_powershell = AsyncMock(return_value=("", "", 1))
+    pc_control_service.ssh.execute_powershell_stream.return_value = ("", "", 1)
 
-    # Reduce timeout for faster test
-    with patch("api.services.pc_control.settings") as mock_settings:
-        mock_settings.desktop_timeout = 1
-        mock_settings.pc_ip = "192.168.1.100"
-        mock_settings.pc_user = "testuser"
-        mock_settings.ssh_key_path = "/tmp/test_key"
-        mock_settings.ssh_connect_timeout = 5
+    # Single-shot poller: one failed probe, no wall-clock wait
+    pc_control_service._poller = InstantPoller()
 
-        result = await pc_control_service.wait_for_desktop()
+    result = await pc_control_service.wait_for_desktop()
 
-        assert result is False
+    assert result is False
+    pc_control_service.ssh.execute_powershell_stream.assert_called_once()
+
+
+async def test_stop_sunshine_and_kill_zwift_success(pc_control_service):
+    """Test the batched pre-launch cleanup call."""
+    pc_control_service.ssh.execute_powershell.return_value = ("sunshine=stopped killed=2", "", 0)
+
+    sunshine_stopped, zwift_killed = await pc_control_service.stop_sunshine_and_kill_zwift()
+
+    assert sunshine_stopped is True
+    assert zwift_killed is True
+    pc_control_service.ssh.execute_powershell.assert_called_once()
+
+
+async def test_stop_sunshine_and_kill_zwift_exception(pc_control_service):
+    """Test batched cleanup degrades gracefully on SSH errors."""
+    pc_control_service.ssh.execute_powershell.side_effect = Exception("SSH error")
+
+    sunshine_stopped, zwift_killed = await pc_control_service.stop_sunshine_and_kill_zwift()
+
+    assert sunshine_stopped is False
+    assert zwift_killed is True
 
 
-@pytest.mark.asyncio
 async def test_stop_sunshine_success(pc_control_service):
     """Test successful Sunshine service stop."""
-    pc_control_service.ssh.execute_powershell = AsyncMock(
-        return_value=("Stopped successfully", "", 0)
-    )
+    pc_control_service.ssh.execute_powershell.return_value = ("Stopped successfully", "", 0)
 
     result = await pc_control_service.stop_sunshine()
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_stop_sunshine_not_found(pc_control_service):
     """Test Sunshine service not found."""
-    pc_control_service.ssh.execute_powershell = AsyncMock(return_value=("Service not found", "", 1))
+    pc_control_service.ssh.execute_powershell.return_value = ("Service not found", "", 1)
 
     result = await pc_control_service.stop_sunshine()
 
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_start_sunshine_success(pc_control_service):
     """Test successful Sunshine service start."""
-    pc_control_service.ssh.execute_powershell = AsyncMock(
-        return_value=("Started successfully", "", 0)
-    )
+    pc_control_service.ssh.execute_powershell.return_value = ("Started successfully", "", 0)
 
     result = await pc_control_service.start_sunshine()
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_launch_zwift_success(pc_control_service):
     """Test successful Zwift launch via scheduled task."""
-    pc_control_service.ssh.execute = AsyncMock(return_value=("SUCCESS", "", 0))
+    pc_control_service.ssh.execute.return_value = ("SUCCESS", "", 0)
 
     result = await pc_control_service.launch_zwift()
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_launch_zwift_failure(pc_control_service):
     """Test Zwift launch failure."""
-    pc_control_service.ssh.execute = AsyncMock(return_value=("", "Task not found", 1))
+    pc_control_service.ssh.execute.return_value = ("", "Task not found", 1)
 
     result = await pc_control_service.launch_zwift()
 
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_activate_zwift_launcher_success(pc_control_service, monkeypatch):
     """Test successful Zwift launcher activation via scheduled task."""
-    pc_control_service.ssh.execute = AsyncMock(
-        return_value=("SUCCESS: Attempted to run the scheduled task", "", 0)
+    pc_control_service.ssh.execute.return_value = (
+        "SUCCESS: Attempted to run the scheduled task",
+        "",
+        0,
     )
+    # The automation wait polls for ZwiftApp; report it immediately so
+    # the wait exits on its first probe
+    pc_control_service.ssh.execute_powershell_stream.return_value = ("ZwiftApp", "", 0)
 
-    # Mock asyncio.sleep to avoid 35-second delay
+    # Mock asyncio.sleep to avoid the automation wait's backoff delay
     async def mock_sleep(seconds):
         pass
 
@@ -161,17 +249,16 @@ async def test_activate_zwift_launcher_success(pc_control_service, monkeypatch):
 
     assert result is True
 
-    # Verify scheduled task was triggered
-    call_args = pc_control_service.ssh.execute.call_args
-    command = call_args[0][0]
-    assert 'schtasks /Run /TN "ZwiftLauncherKeys"' in command
+    # Verify scheduled task was triggered (later calls poll for ZwiftApp)
+    assert pc_control_service.ssh.execute.call_args_list[0].args[0] == EXPECTED_LAUNCHER_COMMAND
 
 
-@pytest.mark.asyncio
 async def test_activate_zwift_launcher_failure(pc_control_service):
     """Test Zwift launcher activation failure."""
-    pc_control_service.ssh.execute = AsyncMock(
-        return_value=("", "ERROR: The system cannot find the path specified", 1)
+    pc_control_service.ssh.execute.return_value = (
+        "",
+        "ERROR: The system cannot find the path specified",
+        1,
     )
 
     result = await pc_control_service.activate_zwift_launcher()
@@ -179,10 +266,9 @@ async def test_activate_zwift_launcher_failure(pc_control_service):
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_activate_zwift_launcher_exception(pc_control_service):
     """Test Zwift launcher activation handles exceptions gracefully."""
-    pc_control_service.ssh.execute = AsyncMock(side_effect=Exception("SSH connection lost"))
+    pc_control_service.ssh.execute.side_effect = Exception("SSH connection lost")
 
     result = await pc_control_service.activate_zwift_launcher()
 
@@ -190,20 +276,18 @@ async def test_activate_zwift_launcher_exception(pc_control_service):
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_launch_sauce_success(pc_control_service):
     """Test successful Sauce launch."""
-    pc_control_service.ssh.execute = AsyncMock(return_value=("SUCCESS", "", 0))
+    pc_control_service.ssh.execute.return_value = ("SUCCESS", "", 0)
 
     result = await pc_control_service.launch_sauce()
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_launch_sauce_failure(pc_control_service):
     """Test Sauce launch failure (non-critical)."""
-    pc_control_service.ssh.execute = AsyncMock(return_value=("", "Task not found", 1))
+    pc_control_service.ssh.execute.return_value = ("", "Task not found", 1)
 
     # Should still return True (non-critical operation)
     result = await pc_control_service.launch_sauce()
@@ -211,40 +295,35 @@ async def test_launch_sauce_failure(pc_control_service):
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_wait_for_zwift_success(pc_control_service):
     """Test successful Zwift process detection."""
-    pc_control_service.ssh.execute_powershell = AsyncMock(return_value=("ZwiftApp", "", 0))
+    pc_control_service.ssh.execute_powershell_stream.return_value = ("ZwiftApp", "", 0)
 
     result = await pc_control_service.wait_for_zwift()
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_wait_for_zwift_timeout(pc_control_service):
     """Test Zwift process detection timeout."""
     # Mock empty output (Zwift not found)
-    pc_control_service.ssh.execute_powershell = AsyncMock(return_value=("", "", 1))
+    pc_control_service.ssh.execute_powershell_stream.return_value = ("", "", 1)
 
-    # Reduce timeout for faster test
-    with patch("api.services.pc_control.settings") as mock_settings:
-        mock_settings.zwift_timeout = 1
-        mock_settings.pc_ip = "192.168.1.100"
-        mock_settings.pc_user = "testuser"
-        mock_settings.ssh_key_path = "/tmp/test_key"
-        mock_settings.ssh_connect_timeout = 5
+    # Single-shot poller: one failed probe, no wall-clock wait
+    pc_control_service._poller = InstantPoller()
 
-        result = await pc_control_service.wait_for_zwift()
+    result = await pc_control_service.wait_for_zwift()
 
-        assert result is False
+    assert result is False
+    pc_control_service.ssh.execute_powershell_stream.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_set_process_priorities_success(pc_control_service):
     """Test successful process priority setting."""
-    pc_control_service.ssh.execute_powershell = AsyncMock(
-        return_value=("Zwift: High priority\nOBS: BelowNormal priority", "", 0)
+    pc_control_service.ssh.execute_powershell_stream.return_value = (
+        "Zwift: High priority\nOBS: BelowNormal priority",
+        "",
+        0,
     )
 
     result = await pc_control_service.set_process_priorities()
@@ -252,10 +331,9 @@ async def test_set_process_priorities_success(pc_control_service):
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_set_process_priorities_exception(pc_control_service):
     """Test process priority setting handles exceptions gracefully."""
-    pc_control_service.ssh.execute_powershell = AsyncMock(side_effect=Exception("SSH error"))
+    pc_control_service.ssh.execute_powershell_stream.side_effect = Exception("SSH error")
 
     # Should return True (non-critical operation)
     result = await pc_control_service.set_process_priorities()
@@ -263,45 +341,32 @@ async def test_set_process_priorities_exception(pc_control_service):
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_shutdown_pc_success(pc_control_service):
     """Test successful PC shutdown."""
-    pc_control_service.ssh.execute = AsyncMock(return_value=("", "", 0))
+    pc_control_service.ssh.execute.return_value = ("", "", 0)
 
     result = await pc_control_service.shutdown_pc()
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_shutdown_pc_failure(pc_control_service):
     """Test PC shutdown failure."""
-    pc_control_service.ssh.execute = AsyncMock(side_effect=Exception("Connection lost"))
+    pc_control_service.ssh.execute.side_effect = Exception("Connection lost")
 
     result = await pc_control_service.shutdown_pc()
 
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_full_start_sequence_success(pc_control_service):
     """Test successful full start sequence."""
-    # Mock all steps to succeed
-    pc_control_service.wake_pc = AsyncMock(return_value=True)
-    pc_control_service.wait_for_network = AsyncMock(return_value=True)
-    pc_control_service.wait_for_ssh = AsyncMock(return_value=True)
-    pc_control_service.wait_for_desktop = AsyncMock(return_value=True)
-    pc_control_service.stop_sunshine = AsyncMock(return_value=True)
-    pc_control_service.launch_zwift = AsyncMock(return_value=True)
-    pc_control_service.launch_sauce = AsyncMock(return_value=True)
-    pc_control_service.wait_for_zwift = AsyncMock(return_value=True)
-    pc_control_service.set_process_priorities = AsyncMock(return_value=True)
+    mock_all_steps(pc_control_service)
 
     result = await pc_control_service.full_start_sequence()
 
     assert result["success"] is True
     assert result["wol_sent"] is True
-    assert result["network_available"] is True
     assert result["ssh_available"] is True
     assert result["desktop_loaded"] is True
     assert result["sunshine_stopped"] is True
@@ -311,62 +376,49 @@ async def test_full_start_sequence_success(pc_control_service):
     assert result["priorities_set"] is True
 
 
-@pytest.mark.asyncio
-async def test_full_start_sequence_wol_failure(pc_control_service):
-    """Test full start sequence fails at WoL step."""
-    pc_control_service.wake_pc = AsyncMock(return_value=False)
+@pytest.mark.parametrize(
+    "failing_step, failed_key, unreached_key",
+    [
+        ("wake_pc", "wol_sent", "ssh_available"),
+        # Sauce launches concurrently with Zwift, so the first result
+        # key the failure blocks is the Zwift-running wait
+        ("launch_zwift_and_activate", "zwift_launched", "zwift_running"),
+    ],
+)
+async def test_full_start_sequence_step_failure(
+    pc_control_service, failing_step, failed_key, unreached_key
+):
+    """Test the full start sequence stops at a failed step."""
+    mock_all_steps(pc_control_service, **{failing_step: False})
 
     result = await pc_control_service.full_start_sequence()
 
     assert result["success"] is False
-    assert result["wol_sent"] is False
-    # Subsequent steps should not be attempted
-    assert result["network_available"] is False
+    assert result[failed_key] is False
+    # Steps after the failed one should not be attempted
+    assert result[unreached_key] is False
 
 
-@pytest.mark.asyncio
-async def test_full_start_sequence_zwift_launch_failure(pc_control_service):
-    """Test full start sequence fails at Zwift launch."""
-    # Mock steps up to Zwift launch
+async def test_full_start_sequence_already_running(pc_control_service):
+    """Test full start sequence short-circuits when Zwift is already up."""
+    mock_precheck(pc_control_service, online=True, zwift_running=True)
     pc_control_service.wake_pc = AsyncMock(return_value=True)
-    pc_control_service.wait_for_network = AsyncMock(return_value=True)
-    pc_control_service.wait_for_ssh = AsyncMock(return_value=True)
-    pc_control_service.wait_for_desktop = AsyncMock(return_value=True)
-    pc_control_service.stop_sunshine = AsyncMock(return_value=True)
-    pc_control_service.launch_zwift = AsyncMock(return_value=False)
 
     result = await pc_control_service.full_start_sequence()
 
-    assert result["success"] is False
-    assert result["zwift_launched"] is False
-    # Subsequent steps should not be attempted
-    assert result["sauce_launched"] is False
-
-
-@pytest.mark.asyncio
-async def test_wake_only_sequence_success(pc_control_service):
-    """Test successful wake-only sequence."""
-    pc_control_service.wake_pc = AsyncMock(return_value=True)
-    pc_control_service.wait_for_network = AsyncMock(return_value=True)
-    pc_control_service.wait_for_ssh = AsyncMock(return_value=True)
-
-    result = await pc_control_service.wake_only_sequence()
-
     assert result["success"] is True
-    assert result["wol_sent"] is True
-    assert result["network_available"] is True
-    assert result["ssh_available"] is True
+    # No wake needed - the PC was already online with Zwift running
+    pc_control_service.wake_pc.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_wake_only_sequence_network_timeout(pc_control_service):
-    """Test wake-only sequence fails at network wait."""
+@pytest.mark.parametrize("ssh_available", [True, False])
+async def test_wake_only_sequence(pc_control_service, ssh_available):
+    """Test the wake-only sequence with and without SSH coming up."""
     pc_control_service.wake_pc = AsyncMock(return_value=True)
-    pc_control_service.wait_for_network = AsyncMock(return_value=False)
+    pc_control_service.wait_for_ssh = AsyncMock(return_value=ssh_available)
 
     result = await pc_control_service.wake_only_sequence()
 
-    assert result["success"] is False
+    assert result["success"] is ssh_available
     assert result["wol_sent"] is True
-    assert result["network_available"] is False
-    assert result["ssh_available"] is False
+    assert result["ssh_available"] is ssh_available
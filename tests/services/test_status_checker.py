@@ -0,0 +1,103 @@
+"""Tests for the status checker's process probes."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.services.status_checker import StatusChecker
+from api.utils.ssh_client import get_ssh_client
+
+
+@pytest.fixture
+def status_checker(test_settings):
+    """Create a StatusChecker with its SSH client mocked out."""
+    # Clear the shared-client cache so the checker gets a fresh SSHClient
+    # rather than one carrying mocks from another test module
+    get_ssh_client.cache_clear()
+    with patch("api.services.status_checker.settings", test_settings):
+        checker = StatusChecker()
+    checker.ssh.execute = AsyncMock()
+    checker.ssh.execute_powershell = AsyncMock()
+    return checker
+
+
+async def test_check_zwift_running_reports_cpu(status_checker):
+    """Test that the Zwift probe keeps CPU time in its response."""
+    status_checker.ssh.execute_powershell.return_value = ("12345,4500.5,1073741824", "", 0)
+
+    status = await status_checker.check_zwift_running()
+
+    assert status.running is True
+    assert status.process_id == 12345
+    assert status.cpu_usage == 4500.5
+    assert status.memory_mb == 1024
+    # /status/zwift exposes cpu_usage, so the tasklist fast path (which
+    # cannot report CPU) must not answer this probe
+    status_checker.ssh.execute.assert_not_called()
+
+
+async def test_check_obs_running_uses_tasklist(status_checker):
+    """Test that the OBS probe answers from the tasklist fast path."""
+    status_checker.ssh.execute.return_value = (
+        '"obs64.exe","4242","Console","1","524,288 K"',
+        "",
+        0,
+    )
+
+    status = await status_checker.check_obs_running()
+
+    assert status.running is True
+    assert status.process_id == 4242
+    assert status.memory_mb == 512
+    assert status.cpu_usage is None
+    status_checker.ssh.execute_powershell.assert_not_called()
+
+
+async def test_batched_status_success(status_checker):
+    """Test that the batched probe parses a well-formed payload."""
+    status_checker.ssh.execute_powershell.return_value = (
+        '{"zwift": {"Id": 12345, "CPU": 4500.5, "WorkingSet64": 1073741824},'
+        ' "obs": null, "sunshine": {"Status": "Running"}}',
+        "",
+        0,
+    )
+
+    zwift, sunshine, obs = await status_checker._check_detailed_status_batched()
+
+    assert zwift.running is True
+    assert zwift.process_id == 12345
+    assert zwift.cpu_usage == 4500.5
+    assert zwift.memory_mb == 1024
+    assert sunshine.running is True
+    assert obs.running is False
+
+
+async def test_batched_status_falls_back_on_array_entry(status_checker):
+    """Test that an array-valued entry degrades to the fallback probes.
+
+    ConvertTo-Json emits an array when a Get-Process filter matches more
+    than one process; the probe must report failure (None) so
+    check_full_status runs the individual probes instead of raising.
+    """
+    status_checker.ssh.execute_powershell.return_value = (
+        '{"zwift": [{"Id": 1, "CPU": 1.5, "WorkingSet64": 1048576},'
+        ' {"Id": 2, "CPU": 0.5, "WorkingSet64": 1048576}],'
+        ' "obs": null, "sunshine": null}',
+        "",
+        0,
+    )
+
+    assert await status_checker._check_detailed_status_batched() is None
+
+
+async def test_check_process_falls_back_to_powershell(status_checker):
+    """Test that a failed tasklist probe falls back to PowerShell."""
+    status_checker.ssh.execute.side_effect = RuntimeError("connection lost")
+    status_checker.ssh.execute_powershell.return_value = ("4242,12.5,536870912", "", 0)
+
+    status = await status_checker.check_obs_running()
+
+    assert status.running is True
+    assert status.process_id == 4242
+    assert status.cpu_usage == 12.5
+    assert status.memory_mb == 512
@@ -0,0 +1,165 @@
+"""Tests for the task manager."""
+
+import asyncio
+
+import pytest_asyncio
+
+from api.models import TaskStatus
+from api.services.task_manager import MAX_TASKS, TaskManager
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def manager():
+    """Create a fresh TaskManager per test.
+
+    The global instance is shared with the app under test, so these
+    tests get their own manager; the teardown cancels any worker the
+    test started so it cannot outlive the test.
+    """
+    tm = TaskManager()
+    yield tm
+    if tm._worker_task is not None:
+        tm._worker_task.cancel()
+        await asyncio.gather(tm._worker_task, return_exceptions=True)
+
+
+async def test_wait_for_completion_returns_on_completion(manager):
+    """Test that a long-poll wakes as soon as the task finishes."""
+    task = manager.create_task("start")
+    waiter = asyncio.create_task(manager.wait_for_completion(task.task_id, timeout=5))
+    await asyncio.sleep(0)
+
+    manager.mark_task_completed(task.task_id)
+
+    record = await asyncio.wait_for(waiter, timeout=1)
+    assert record.status is TaskStatus.COMPLETED
+
+
+async def test_wait_for_completion_times_out(manager):
+    """Test that a long-poll returns the current state on timeout."""
+    task = manager.create_task("start")
+
+    record = await manager.wait_for_completion(task.task_id, timeout=0.05)
+
+    assert record.status is TaskStatus.PENDING
+
+
+async def test_wait_for_completion_unknown_task(manager):
+    """Test that waiting on an unknown task returns None immediately."""
+    task = manager.create_task("start")
+    manager.tasks.pop(task.task_id)
+
+    assert await manager.wait_for_completion(task.task_id, timeout=5) is None
+
+
+def test_create_task_evicts_oldest(manager):
+    """Test that the store stays bounded and drops the oldest task."""
+    first = manager.create_task("start")
+    for _ in range(MAX_TASKS):
+        manager.create_task("start")
+
+    assert len(manager.tasks) == MAX_TASKS
+    assert first.task_id not in manager.tasks
+    assert first.task_id not in manager._events
+
+
+async def test_launch_runs_sequences_one_at_a_time(manager):
+    """Test that queued sequences wait for the running one to finish."""
+    order = []
+    first_running = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocker(task_id):
+        manager.mark_task_running(task_id)
+        order.append("first")
+        first_running.set()
+        await release.wait()
+        manager.mark_task_completed(task_id)
+
+    async def follower(task_id):
+        order.append("second")
+        manager.mark_task_completed(task_id)
+
+    first = manager.create_task("start")
+    second = manager.create_task("start")
+    manager.launch(first.task_id, blocker)
+    manager.launch(second.task_id, follower)
+
+    await asyncio.wait_for(first_running.wait(), timeout=1)
+    assert order == ["first"]
+
+    release.set()
+    await asyncio.wait_for(manager._queue.join(), timeout=1)
+    assert order == ["first", "second"]
+    assert manager.tasks[second.task_id].status is TaskStatus.COMPLETED
+
+
+async def test_cancel_running_task_keeps_worker_alive(manager):
+    """Test that cancelling a running task fails it but not the worker."""
+    started = asyncio.Event()
+
+    async def hang(task_id):
+        manager.mark_task_running(task_id)
+        started.set()
+        await asyncio.Event().wait()
+
+    task = manager.create_task("start")
+    manager.launch(task.task_id, hang)
+    await asyncio.wait_for(started.wait(), timeout=1)
+
+    assert manager.cancel_task(task.task_id) is True
+
+    record = await asyncio.wait_for(manager.wait_for_completion(task.task_id, timeout=1), timeout=2)
+    assert record.status is TaskStatus.FAILED
+    assert record.error == "Task cancelled"
+
+    # The worker must keep serving the queue after the cancellation
+    completed = asyncio.Event()
+
+    async def follow_up(task_id):
+        manager.mark_task_completed(task_id)
+        completed.set()
+
+    next_task = manager.create_task("wake")
+    manager.launch(next_task.task_id, follow_up)
+    await asyncio.wait_for(completed.wait(), timeout=1)
+
+
+async def test_cancel_queued_task_is_skipped(manager):
+    """Test that a task cancelled while queued never runs."""
+    first_running = asyncio.Event()
+    release = asyncio.Event()
+    ran = []
+
+    async def blocker(task_id):
+        manager.mark_task_running(task_id)
+        first_running.set()
+        await release.wait()
+        manager.mark_task_completed(task_id)
+
+    async def skipped(task_id):
+        ran.append(task_id)
+        manager.mark_task_completed(task_id)
+
+    first = manager.create_task("start")
+    second = manager.create_task("start")
+    manager.launch(first.task_id, blocker)
+    manager.launch(second.task_id, skipped)
+    await asyncio.wait_for(first_running.wait(), timeout=1)
+
+    # Second is still PENDING in the queue: no runner to cancel, but the
+    # worker must skip it once its turn comes
+    assert manager.cancel_task(second.task_id) is True
+
+    release.set()
+    await asyncio.wait_for(manager._queue.join(), timeout=1)
+    assert ran == []
+    assert manager.tasks[second.task_id].status is TaskStatus.FAILED
+
+
+async def test_cancel_finished_task_returns_false(manager):
+    """Test that a completed task cannot be cancelled."""
+    task = manager.create_task("start")
+    manager.mark_task_completed(task.task_id)
+
+    assert manager.cancel_task(task.task_id) is False
@@ -1,11 +1,100 @@
 """Tests for control endpoints."""
 
-from unittest.mock import AsyncMock, patch
-from uuid import uuid4
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
 
 import pytest
+from pytest import MonkeyPatch
 
+from api.main import app
 from api.models import ServiceStatus, Task, TaskStatus
+from api.routers.control import get_pc_control, get_status_checker
+from api.services.pc_control import PCControlService
+from api.services.status_checker import StatusChecker
+from api.services.task_manager import TaskManager
+
+# Fixed task UUID shared by the task tests; uuid4() costs an os.urandom
+# syscall per call and the tests only need a stable, valid identifier
+TEST_TASK_ID = UUID("00000000-0000-4000-8000-000000000001")
+
+# Prebuilt model templates: model_copy(update=...) skips the full
+# validation pass that Task(...) runs on every construction
+TASK_TEMPLATE = Task(task_id=TEST_TASK_ID, status=TaskStatus.PENDING, task_type="start")
+SUNSHINE_RUNNING = ServiceStatus(name="SunshineService", running=True, status="Running")
+SUNSHINE_STOPPED = ServiceStatus(name="SunshineService", running=False, status="Stopped")
+
+
+def assert_subset(actual: dict, expected: dict) -> None:
+    """Assert every expected key/value pair appears in actual, in one pass."""
+    mismatched = {
+        key: actual.get(key) for key, value in expected.items() if actual.get(key) != value
+    }
+    assert not mismatched, f"expected {expected}, got {mismatched}"
+
+
+@pytest.fixture(scope="module")
+def control_mocks():
+    """Replace the control router's collaborators once for the module.
+
+    The services the routes receive via Depends are swapped through
+    app.dependency_overrides (a plain dict assignment); task_manager and
+    ping_host are module attributes, so those go through one MonkeyPatch
+    for the module. The autouse reset fixture below clears per-test
+    configuration.
+    """
+    mp = MonkeyPatch()
+    # spec'd mocks resolve attributes against the real class once
+    # (instead of lazily growing a child mock per access) and catch
+    # misspelled method names at test-write time
+    mocks = {
+        "task_manager": MagicMock(spec=TaskManager),
+        "pc_control": MagicMock(spec=PCControlService),
+        "status_checker": MagicMock(spec=StatusChecker),
+        "ping_host": AsyncMock(),
+    }
+    mp.setattr("api.routers.control.task_manager", mocks["task_manager"])
+    mp.setattr("api.routers.control.ping_host", mocks["ping_host"])
+    app.dependency_overrides[get_pc_control] = lambda: mocks["pc_control"]
+    app.dependency_overrides[get_status_checker] = lambda: mocks["status_checker"]
+    yield mocks
+    mp.undo()
+    app.dependency_overrides.pop(get_pc_control, None)
+    app.dependency_overrides.pop(get_status_checker, None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_control_mocks(control_mocks):
+    """Reset shared router mocks before each test."""
+    for mock in control_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    # Routes serialize internal task records through to_response; the
+    # identity default lets tests hand Task models straight through
+    control_mocks["task_manager"].to_response = lambda record: record
+
+
+@pytest.fixture
+def mock_task_manager(control_mocks):
+    """Shared task manager mock."""
+    return control_mocks["task_manager"]
+
+
+@pytest.fixture
+def mock_pc_control(control_mocks):
+    """Shared PC control service mock."""
+    return control_mocks["pc_control"]
+
+
+@pytest.fixture
+def mock_status_checker(control_mocks):
+    """Shared status checker mock."""
+    return control_mocks["status_checker"]
+
+
+@pytest.fixture
+def mock_ping(control_mocks):
+    """Shared ping_host mock."""
+    return control_mocks["ping_host"]
 
 
 def test_health_check(client):
@@ -17,213 +106,194 @@ def test_health_check(client):
     assert "timestamp" in data
 
 
-@pytest.mark.asyncio
-async def test_start_zwift(client):
+def test_start_zwift(client, mock_task_manager):
     """Test start Zwift endpoint."""
-    with patch("api.routers.control.task_manager") as mock_task_manager:
-        # Mock task creation - return a proper Task object
-        test_task_id = uuid4()
-        mock_task = Task(task_id=test_task_id, status=TaskStatus.PENDING, task_type="start")
-        mock_task_manager.create_task.return_value = mock_task
+    # Mock task creation - return a proper Task object
+    mock_task = TASK_TEMPLATE
+    mock_task_manager.create_task.return_value = mock_task
 
-        response = client.post("/api/v1/control/start")
+    response = client.post("/api/v1/control/start")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "task_id" in data
-        assert data["task_id"] == str(test_task_id)
-        assert "message" in data
-        assert "estimated_duration_seconds" in data
-        assert data["estimated_duration_seconds"] == 180
+    assert response.status_code == 200
+    data = response.json()
+    assert_subset(data, {"task_id": str(TEST_TASK_ID), "estimated_duration_seconds": 180})
+    assert "message" in data
 
 
-@pytest.mark.asyncio
-async def test_stop_pc_offline(client):
+def test_stop_pc_offline(client, mock_ping):
     """Test stop endpoint when PC is offline."""
-    with patch("api.routers.control.ping_host") as mock_ping:
-        # Mock PC offline
-        mock_ping.return_value = (False, None)
+    # Mock PC offline
+    mock_ping.return_value = (False, None)
 
-        response = client.post("/api/v1/control/stop")
+    response = client.post("/api/v1/control/stop")
 
-        assert response.status_code == 400
-        assert "not online" in response.json()["detail"].lower()
+    assert response.status_code == 400
+    assert "not online" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
-async def test_stop_pc_online(client):
+def test_stop_pc_online(client, mock_ping, mock_pc_control):
     """Test stop endpoint when PC is online."""
-    with (
-        patch("api.routers.control.ping_host") as mock_ping,
-        patch("api.routers.control.PCControlService") as mock_pc_control,
-    ):
-        # Mock PC online
-        mock_ping.return_value = (True, 5)
+    # Mock PC online
+    mock_ping.return_value = (True, 5)
 
-        # Mock shutdown success
-        mock_service = AsyncMock()
-        mock_service.shutdown_pc = AsyncMock(return_value=True)
-        mock_pc_control.return_value = mock_service
+    # Mock shutdown success
+    mock_pc_control.shutdown_pc = AsyncMock(return_value=True)
 
-        response = client.post("/api/v1/control/stop")
+    response = client.post("/api/v1/control/stop")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert "shutdown" in data["message"].lower()
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert "shutdown" in data["message"].lower()
 
 
-@pytest.mark.asyncio
-async def test_wake_pc(client):
+def test_wake_pc(client, mock_task_manager):
     """Test wake PC endpoint."""
-    with patch("api.routers.control.task_manager") as mock_task_manager:
-        # Mock task creation - return a proper Task object
-        test_task_id = uuid4()
-        mock_task = Task(task_id=test_task_id, status=TaskStatus.PENDING, task_type="wake")
-        mock_task_manager.create_task.return_value = mock_task
+    # Mock task creation - return a proper Task object
+    mock_task = TASK_TEMPLATE.model_copy(update={"task_type": "wake"})
+    mock_task_manager.create_task.return_value = mock_task
 
-        response = client.post("/api/v1/control/wake")
+    response = client.post("/api/v1/control/wake")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "task_id" in data
-        assert data["task_id"] == str(test_task_id)
-        assert "message" in data
-        assert "estimated_duration_seconds" in data
-        assert data["estimated_duration_seconds"] == 60
+    assert response.status_code == 200
+    data = response.json()
+    assert_subset(data, {"task_id": str(TEST_TASK_ID), "estimated_duration_seconds": 60})
+    assert "message" in data
 
 
-def test_get_task_not_found(client):
+def test_get_task_not_found(client, mock_task_manager):
     """Test getting task status for non-existent task."""
-    with patch("api.routers.control.task_manager") as mock_task_manager:
-        mock_task_manager.get_task.return_value = None
+    mock_task_manager.get_task.return_value = None
 
-        # Use a valid UUID format
-        non_existent_uuid = uuid4()
-        response = client.get(f"/api/v1/control/tasks/{non_existent_uuid}")
+    # Use a valid UUID format
+    response = client.get(f"/api/v1/control/tasks/{TEST_TASK_ID}")
 
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
+    assert response.status_code == 404
+    assert "not found" in response.json()["detail"].lower()
+
+
+def test_get_task_wait(client, mock_task_manager):
+    """Test long-polling task status with wait=true."""
+    mock_task = TASK_TEMPLATE.model_copy(update={"status": TaskStatus.COMPLETED})
+    mock_task_manager.wait_for_completion = AsyncMock(return_value=mock_task)
+
+    response = client.get(f"/api/v1/control/tasks/{TEST_TASK_ID}?wait=true")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    mock_task_manager.wait_for_completion.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_toggle_sunshine_stop_when_running(client):
+def test_cancel_task(client, mock_task_manager):
+    """Test cancelling a running task."""
+    mock_task = TASK_TEMPLATE.model_copy(update={"status": TaskStatus.FAILED})
+    mock_task_manager.get_task.return_value = mock_task
+    mock_task_manager.cancel_task.return_value = True
+
+    response = client.delete(f"/api/v1/control/tasks/{TEST_TASK_ID}")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "failed"
+    mock_task_manager.cancel_task.assert_called_once()
+
+
+def test_cancel_task_not_running(client, mock_task_manager):
+    """Test cancelling a task that has already finished."""
+    mock_task = TASK_TEMPLATE.model_copy(update={"status": TaskStatus.COMPLETED})
+    mock_task_manager.get_task.return_value = mock_task
+    mock_task_manager.cancel_task.return_value = False
+
+    response = client.delete(f"/api/v1/control/tasks/{TEST_TASK_ID}")
+
+    assert response.status_code == 409
+    assert "cannot be cancelled" in response.json()["detail"].lower()
+
+
+def test_toggle_sunshine_stop_when_running(client, mock_status_checker, mock_pc_control):
     """Test toggle Sunshine when service is currently running (should stop)."""
-    with (
-        patch("api.routers.control.StatusChecker") as mock_status_checker_class,
-        patch("api.routers.control.PCControlService") as mock_pc_control_class,
-    ):
-        # Mock PC online and SSH available
-        mock_status_checker = AsyncMock()
-        mock_pc_status = AsyncMock()
-        mock_pc_status.online = True
-        mock_pc_status.ssh_available = True
-        mock_status_checker.check_pc_online = AsyncMock(return_value=mock_pc_status)
-
-        # Mock Sunshine currently running
-        mock_service_status_before = ServiceStatus(
-            name="SunshineService", running=True, status="Running"
-        )
-
-        # Mock Sunshine stopped after toggle
-        mock_service_status_after = ServiceStatus(
-            name="SunshineService", running=False, status="Stopped"
-        )
-
-        mock_status_checker.check_sunshine_status = AsyncMock(
-            side_effect=[mock_service_status_before, mock_service_status_after]
-        )
-        mock_status_checker_class.return_value = mock_status_checker
-
-        # Mock PC control - stop_sunshine succeeds
-        mock_pc_control = AsyncMock()
-        mock_pc_control.stop_sunshine = AsyncMock(return_value=True)
-        mock_pc_control_class.return_value = mock_pc_control
-
-        response = client.post("/api/v1/control/sunshine/toggle")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert "stopped" in data["message"].lower()
-        assert data["service_status"]["running"] is False
-        mock_pc_control.stop_sunshine.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_toggle_sunshine_start_when_stopped(client):
+    # Mock PC online and SSH available
+    mock_pc_status = SimpleNamespace(online=True, ssh_available=True)
+    mock_status_checker.check_pc_online = AsyncMock(return_value=mock_pc_status)
+
+    # Mock Sunshine currently running
+    mock_service_status_before = ServiceStatus(
+        name="SunshineService", running=True, status="Running"
+    )
+
+    # Mock Sunshine stopped after toggle
+    mock_service_status_after = ServiceStatus(
+        name="SunshineService", running=False, status="Stopped"
+    )
+
+    mock_status_checker.check_sunshine_status = AsyncMock(
+        side_effect=[mock_service_status_before, mock_service_status_after]
+    )
+
+    # Mock PC control - stop_sunshine succeeds
+    mock_pc_control.stop_sunshine = AsyncMock(return_value=True)
+
+    response = client.post("/api/v1/control/sunshine/toggle")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert "stopped" in data["message"].lower()
+    assert data["service_status"]["running"] is False
+    mock_pc_control.stop_sunshine.assert_called_once()
+
+
+def test_toggle_sunshine_start_when_stopped(client, mock_status_checker, mock_pc_control):
     """Test toggle Sunshine when service is currently stopped (should start)."""
-    with (
-        patch("api.routers.control.StatusChecker") as mock_status_checker_class,
-        patch("api.routers.control.PCControlService") as mock_pc_control_class,
-    ):
-        # Mock PC online and SSH available
-        mock_status_checker = AsyncMock()
-        mock_pc_status = AsyncMock()
-        mock_pc_status.online = True
-        mock_pc_status.ssh_available = True
-        mock_status_checker.check_pc_online = AsyncMock(return_value=mock_pc_status)
-
-        # Mock Sunshine currently stopped
-        mock_service_status_before = ServiceStatus(
-            name="SunshineService", running=False, status="Stopped"
-        )
-
-        # Mock Sunshine running after toggle
-        mock_service_status_after = ServiceStatus(
-            name="SunshineService", running=True, status="Running"
-        )
-
-        mock_status_checker.check_sunshine_status = AsyncMock(
-            side_effect=[mock_service_status_before, mock_service_status_after]
-        )
-        mock_status_checker_class.return_value = mock_status_checker
-
-        # Mock PC control - start_sunshine succeeds
-        mock_pc_control = AsyncMock()
-        mock_pc_control.start_sunshine = AsyncMock(return_value=True)
-        mock_pc_control_class.return_value = mock_pc_control
-
-        response = client.post("/api/v1/control/sunshine/toggle")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert "started" in data["message"].lower()
-        assert data["service_status"]["running"] is True
-        mock_pc_control.start_sunshine.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_toggle_sunshine_pc_offline(client):
+    # Mock PC online and SSH available
+    mock_pc_status = SimpleNamespace(online=True, ssh_available=True)
+    mock_status_checker.check_pc_online = AsyncMock(return_value=mock_pc_status)
+
+    # Mock Sunshine currently stopped
+    mock_service_status_before = ServiceStatus(
+        name="SunshineService", running=False, status="Stopped"
+    )
+
+    # Mock Sunshine running after toggle
+    mock_service_status_after = ServiceStatus(
+        name="SunshineService", running=True, status="Running"
+    )
+
+    mock_status_checker.check_sunshine_status = AsyncMock(
+        side_effect=[mock_service_status_before, mock_service_status_after]
+    )
+
+    # Mock PC control - start_sunshine succeeds
+    mock_pc_control.start_sunshine = AsyncMock(return_value=True)
+
+    response = client.post("/api/v1/control/sunshine/toggle")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert "started" in data["message"].lower()
+    assert data["service_status"]["running"] is True
+    mock_pc_control.start_sunshine.assert_called_once()
+
+
+def test_toggle_sunshine_pc_offline(client, mock_status_checker):
     """Test toggle Sunshine when PC is offline."""
-    with patch("api.routers.control.StatusChecker") as mock_status_checker_class:
-        # Mock PC offline
-        mock_status_checker = AsyncMock()
-        mock_pc_status = AsyncMock()
-        mock_pc_status.online = False
-        mock_status_checker.check_pc_online = AsyncMock(return_value=mock_pc_status)
-        mock_status_checker_class.return_value = mock_status_checker
+    # Mock PC offline
+    mock_pc_status = SimpleNamespace(online=False, ssh_available=False)
+    mock_status_checker.check_pc_online = AsyncMock(return_value=mock_pc_status)
 
-        response = client.post("/api/v1/control/sunshine/toggle")
+    response = client.post("/api/v1/control/sunshine/toggle")
 
-        assert response.status_code == 503
-        assert "offline" in response.json()["detail"].lower()
+    assert response.status_code == 503
+    assert "offline" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
-async def test_toggle_sunshine_ssh_unavailable(client):
+def test_toggle_sunshine_ssh_unavailable(client, mock_status_checker):
     """Test toggle Sunshine when SSH is unavailable."""
-    with patch("api.routers.control.StatusChecker") as mock_status_checker_class:
-        # Mock PC online but SSH unavailable
-        mock_status_checker = AsyncMock()
-        mock_pc_status = AsyncMock()
-        mock_pc_status.online = True
-        mock_pc_status.ssh_available = False
-        mock_status_checker.check_pc_online = AsyncMock(return_value=mock_pc_status)
-        mock_status_checker_class.return_value = mock_status_checker
-
-        response = client.post("/api/v1/control/sunshine/toggle")
-
-        assert response.status_code == 503
-        assert "ssh" in response.json()["detail"].lower()
+    # Mock PC online but SSH unavailable
+    mock_pc_status = SimpleNamespace(online=True, ssh_available=False)
+    mock_status_checker.check_pc_online = AsyncMock(return_value=mock_pc_status)
+
+    response = client.post("/api/v1/control/sunshine/toggle")
+
+    assert response.status_code == 503
+    assert "ssh" in response.json()["detail"].lower()